@@ -3,6 +3,32 @@ Diagnostic script to check viewport_3d.py
 """
 import sys
 import os
+import functools
+import mmap
+
+
+@functools.lru_cache(maxsize=None)
+def find_definition(path, marker):
+    """Return the 1-based line that starts with marker, or -1.
+
+    The file is mapped rather than read, so no decoded copy or list of
+    lines is built; find() and count() run as C-level byte scans. Only
+    matches at the start of a line count, so the marker quoted in a
+    comment or string further along a line is skipped.
+    """
+    marker = marker.encode('utf-8')
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(marker)] == marker:
+                return 1
+            offset = mm.find(b'\n' + marker)
+            if offset < 0:
+                return -1
+            return mm[:offset].count(b'\n') + 2
+    except ValueError:
+        # An empty file cannot be mapped
+        return -1
+
 
 print("=" * 50)
 print("VIEWPORT_3D.PY DIAGNOSTIC")
@@ -15,43 +41,40 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Check file exists
 viewport_path = os.path.join(os.path.dirname(__file__), 'editor', 'viewport_3d.py')
 print(f"1. Checking file: {viewport_path}")
-if os.path.exists(viewport_path):
-    print("   ✓ File exists")
-    file_size = os.path.getsize(viewport_path)
-    print(f"   ✓ File size: {file_size:,} bytes")
-else:
+# One stat() answers both "does it exist" and "how big is it"
+try:
+    viewport_stat = os.stat(viewport_path)
+except FileNotFoundError:
     print("   ✗ File NOT found!")
     sys.exit(1)
-
-print()
-
-# Check for class definition
-print("2. Checking for Viewport3D class...")
-with open(viewport_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-    if 'class Viewport3D:' in content:
-        print("   ✓ Class definition found")
-        # Find line number
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if line.strip().startswith('class Viewport3D:'):
-                print(f"   ✓ At line {i}")
-                break
-    else:
-        print("   ✗ Class definition NOT found!")
-        print("   File might be corrupted or incomplete")
+print("   ✓ File exists")
+print(f"   ✓ File size: {viewport_stat.st_size:,} bytes")
 
 print()
 
 # Try to import
-print("3. Attempting import...")
+print("2. Attempting import...")
 try:
     from editor.viewport_3d import Viewport3D
     print("   ✓ Import successful!")
     print(f"   ✓ Class: {Viewport3D}")
     print(f"   ✓ Type: {type(Viewport3D)}")
-except ImportError as e:
-    print(f"   ✗ Import failed: {e}")
+except Exception as e:
+    print(f"   ✗ Import failed: {type(e).__name__}: {e}")
+    print()
+
+    # Only scan the source when the import itself fails; a corrupted file
+    # raises SyntaxError (or anything else at module level), not just
+    # ImportError
+    print("3. Checking for Viewport3D class...")
+    class_line = find_definition(viewport_path, 'class Viewport3D:')
+    if class_line > 0:
+        print("   ✓ Class definition found")
+        print(f"   ✓ At line {class_line}")
+    else:
+        print("   ✗ Class definition NOT found!")
+        print("   File might be corrupted or incomplete")
+
     print()
     print("CHECKING WHAT'S IN THE MODULE:")
     try:
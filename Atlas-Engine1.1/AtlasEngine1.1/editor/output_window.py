@@ -6,23 +6,109 @@ Displays script output with text and 2D sprite rendering for RPG games
 
 import tkinter as tk
 from tkinter import scrolledtext
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from array import array
+from bisect import bisect_left, insort
 import math
 
+class SpriteArrays:
+    """Sprite geometry stored column-wise (one array per field) so bulk
+    transforms walk flat float buffers instead of per-sprite objects"""
+    
+    def __init__(self):
+        self.x = array('d')
+        self.y = array('d')
+        self.width = array('d')
+        self.height = array('d')
+        self.vx = array('d')  # Velocity, used by OutputWindow.integrate_sprites
+        self.vy = array('d')
+        self.free: List[int] = []  # Released rows to reuse
+    
+    def add(self, x, y, width, height) -> int:
+        """Store a sprite's geometry and return its row index"""
+        if self.free:
+            idx = self.free.pop()
+            self.x[idx] = x
+            self.y[idx] = y
+            self.width[idx] = width
+            self.height[idx] = height
+            self.vx[idx] = 0.0
+            self.vy[idx] = 0.0
+            return idx
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        self.vx.append(0.0)
+        self.vy.append(0.0)
+        return len(self.x) - 1
+    
+    def release(self, idx: int):
+        """Return a row to the free list"""
+        self.free.append(idx)
+    
+    def clear(self):
+        """Drop all rows"""
+        for column in (self.x, self.y, self.width, self.height, self.vx, self.vy):
+            del column[:]
+        self.free.clear()
+
 class Sprite:
-    """Simple 2D sprite for the output window"""
-    def __init__(self, x, y, width, height, color="#00ff00", text="", image=None):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+    """Simple 2D sprite for the output window
+    
+    Geometry lives in a SpriteArrays row; the sprite is a view onto it.
+    """
+    
+    # Shape kinds, checked with a plain int compare in the render loop
+    RECT = 0
+    CIRCLE = 1
+    TEXT = 2
+    
+    def __init__(self, x, y, width, height, color="#00ff00", text="", image=None,
+                 store: SpriteArrays = None, kind: int = RECT):
+        self.store = store if store is not None else SpriteArrays()
+        self.index = self.store.add(x, y, width, height)
+        self.name = None  # Set when registered with an OutputWindow
         self.color = color
         self.text = text
         self.image = image
         self.visible = True
         self.layer = 0  # Drawing order
+        self.kind = kind
         self.tags = []
     
+    @property
+    def x(self):
+        return self.store.x[self.index]
+    
+    @x.setter
+    def x(self, value):
+        self.store.x[self.index] = value
+    
+    @property
+    def y(self):
+        return self.store.y[self.index]
+    
+    @y.setter
+    def y(self, value):
+        self.store.y[self.index] = value
+    
+    @property
+    def width(self):
+        return self.store.width[self.index]
+    
+    @width.setter
+    def width(self, value):
+        self.store.width[self.index] = value
+    
+    @property
+    def height(self):
+        return self.store.height[self.index]
+    
+    @height.setter
+    def height(self, value):
+        self.store.height[self.index] = value
+    
     def move(self, dx, dy):
         """Move sprite by delta"""
         self.x += dx
@@ -93,6 +179,10 @@ class OutputWindow:
         self.text_output.tag_config("shout", foreground="#ff6b6b", font=("Consolas", 11, "bold"))
         self.text_output.tag_config("whisper", foreground="#888888", font=("Consolas", 9))
         
+        # Lines written since the last flush, as (text, tag) pairs
+        self._text_buf: List[Tuple[str, str]] = []
+        self._text_flush_pending = False
+        
         # Graphics mode
         self.graphics_frame = tk.Frame(self.content_frame, bg="#000000")
         
@@ -109,6 +199,15 @@ class OutputWindow:
         # Sprite management
         self.sprites: Dict[str, Sprite] = {}
         self.sprite_canvas_ids: Dict[str, List] = {}  # Canvas item IDs for each sprite
+        self.sprite_arrays = SpriteArrays()  # Geometry columns shared by all sprites
+        self._name_to_idx: Dict[str, int] = {}  # Sprite name -> id (SpriteArrays row)
+        self._sprites_by_id: List[Optional[Sprite]] = []  # Dense, None for free rows
+        self._dirty: Set[str] = set()  # Sprites whose canvas items are stale
+        self._layer_dirty = False  # Stacking order needs to be rebuilt
+        # Names kept sorted by (layer, creation order) so rendering never re-sorts
+        self._draw_order: List[Tuple[int, int, str]] = []
+        self._order_keys: Dict[str, Tuple[int, int, str]] = {}
+        self._order_seq = 0
         
         # Show text mode by default
         self.current_mode = "text"
@@ -116,6 +215,8 @@ class OutputWindow:
         
         # Rendering
         self.is_rendering = False
+        self._render_pending = False  # A redraw is queued for the next idle
+        self._needs_flush = False  # Drawing primitives are waiting for a flush
     
     def switch_mode(self):
         """Switch between text and graphics mode"""
@@ -143,17 +244,61 @@ class OutputWindow:
     def clear(self):
         """Clear output"""
         if self.current_mode == "text":
+            self._text_buf.clear()
             self.text_output.delete(1.0, tk.END)
         else:
             self.canvas.delete("all")
             self.sprites.clear()
             self.sprite_canvas_ids.clear()
+            self.sprite_arrays.clear()
+            self._name_to_idx.clear()
+            self._sprites_by_id.clear()
+            self._draw_order.clear()
+            self._order_keys.clear()
+            self._dirty.clear()
+    
+    def clear_graphics(self):
+        """Clear the graphics canvas, keeping the sprites
+        
+        Sprites are redrawn with the next change to any of them, so their
+        old item IDs are dropped and every sprite is flagged for new items.
+        """
+        self.canvas.delete("all")
+        self.sprite_canvas_ids.clear()
+        self._dirty.update(self.sprites)
+        self._layer_dirty = True
     
     # ========== TEXT OUTPUT METHODS ==========
     
     def write(self, text: str, tag: str = None):
-        """Write text to output"""
-        self.text_output.insert(tk.END, text + "\n", tag)
+        """Write text to output (buffered until the next idle)"""
+        self._text_buf.append((text + "\n", tag))
+        if not self._text_flush_pending:
+            self._text_flush_pending = True
+            self.frame.after_idle(self._flush_text)
+    
+    def _flush_text(self):
+        """Insert all buffered lines with one insert and one tag_add per tag"""
+        self._text_flush_pending = False
+        if not self._text_buf:
+            return
+        buf = self._text_buf
+        self._text_buf = []
+        
+        # Work out each piece's "line.col" range in Python while walking the buffer
+        line, col = map(int, self.text_output.index("end-1c").split('.'))
+        ranges: Dict[str, List[str]] = {}
+        for text, tag in buf:
+            start = f"{line}.{col}"
+            newlines = text.count("\n")
+            line += newlines
+            col = len(text) - text.rfind("\n") - 1 if newlines else col + len(text)
+            if tag:
+                ranges.setdefault(tag, []).extend((start, f"{line}.{col}"))
+        
+        self.text_output.insert(tk.END, "".join(text for text, _ in buf))
+        for tag, indices in ranges.items():
+            self.text_output.tag_add(tag, *indices)
         self.text_output.see(tk.END)
     
     def write_line(self, text: str, tag: str = None):
@@ -197,93 +342,229 @@ class OutputWindow:
     def create_sprite(self, name: str, x: float, y: float, width: float, height: float,
                      color: str = "#00ff00", text: str = "", layer: int = 0):
         """Create a new sprite"""
-        sprite = Sprite(x, y, width, height, color, text)
+        sprite = Sprite(x, y, width, height, color, text, store=self.sprite_arrays)
         sprite.layer = layer
-        self.sprites[name] = sprite
-        self.sprite_canvas_ids[name] = []
-        
-        if self.current_mode == "graphics":
-            self.render_sprites()
+        return self._add_sprite(name, sprite)
     
     def create_rect_sprite(self, name: str, x: float, y: float, width: float, height: float,
                           color: str = "#00ff00", layer: int = 0):
         """Create rectangle sprite"""
-        self.create_sprite(name, x, y, width, height, color, "", layer)
+        return self.create_sprite(name, x, y, width, height, color, "", layer)
     
     def create_circle_sprite(self, name: str, x: float, y: float, radius: float,
                             color: str = "#00ff00", layer: int = 0):
         """Create circle sprite"""
-        sprite = Sprite(x - radius, y - radius, radius * 2, radius * 2, color)
+        sprite = Sprite(x - radius, y - radius, radius * 2, radius * 2, color,
+                        store=self.sprite_arrays, kind=Sprite.CIRCLE)
         sprite.layer = layer
-        sprite.tags.append("circle")
-        self.sprites[name] = sprite
-        self.sprite_canvas_ids[name] = []
-        
-        if self.current_mode == "graphics":
-            self.render_sprites()
+        return self._add_sprite(name, sprite)
     
     def create_text_sprite(self, name: str, x: float, y: float, text: str,
                           color: str = "#ffffff", size: int = 12, layer: int = 0):
         """Create text sprite"""
-        sprite = Sprite(x, y, 0, 0, color, text)
+        sprite = Sprite(x, y, 0, 0, color, text, store=self.sprite_arrays, kind=Sprite.TEXT)
         sprite.layer = layer
-        sprite.tags.append("text")
+        return self._add_sprite(name, sprite)
+    
+    def _add_sprite(self, name: str, sprite: Sprite) -> int:
+        """Register a sprite, replacing any previous sprite with the same name,
+        and return its id"""
+        self._delete_sprite_items(name)
+        old_idx = self._name_to_idx.get(name)
+        if old_idx is not None:
+            self.sprite_arrays.release(old_idx)
+            self._sprites_by_id[old_idx] = None
+        
+        sprite_id = sprite.index
+        if sprite_id >= len(self._sprites_by_id):
+            self._sprites_by_id.extend([None] * (sprite_id + 1 - len(self._sprites_by_id)))
+        self._sprites_by_id[sprite_id] = sprite
+        sprite.name = name
+        
+        self._name_to_idx[name] = sprite_id
         self.sprites[name] = sprite
         self.sprite_canvas_ids[name] = []
-        
-        if self.current_mode == "graphics":
-            self.render_sprites()
+        self._set_draw_order(name, sprite.layer)
+        self._mark_dirty(name)
+        return sprite_id
+    
+    def get_sprite_id(self, name: str) -> Optional[int]:
+        """Get the id of a named sprite, or None if there is none"""
+        return self._name_to_idx.get(name)
+    
+    def _set_draw_order(self, name: str, layer: int):
+        """Insert or reposition a sprite in the layer-ordered index"""
+        key = self._order_keys.get(name)
+        if key is not None:
+            del self._draw_order[bisect_left(self._draw_order, key)]
+            seq = key[1]
+        else:
+            seq = self._order_seq
+            self._order_seq += 1
+        key = (layer, seq, name)
+        insort(self._draw_order, key)
+        self._order_keys[name] = key
+        self._layer_dirty = True
     
     def move_sprite(self, name: str, dx: float, dy: float):
         """Move sprite by delta"""
         if name in self.sprites:
             self.sprites[name].move(dx, dy)
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
+    
+    def move_sprite_by_id(self, sprite_id: int, dx: float, dy: float):
+        """Move sprite by delta, addressed by id (for per-frame animation loops)
+        
+        Like move_sprite with an unknown name, an id that is out of range or
+        belongs to a deleted sprite is ignored.
+        """
+        if not 0 <= sprite_id < len(self._sprites_by_id):
+            return
+        sprite = self._sprites_by_id[sprite_id]
+        if sprite is not None:
+            self.sprite_arrays.x[sprite_id] += dx
+            self.sprite_arrays.y[sprite_id] += dy
+            self._mark_dirty(sprite.name)
+    
+    def set_sprite_velocity(self, name: str, vx: float, vy: float):
+        """Set the velocity applied by integrate_sprites"""
+        idx = self._name_to_idx.get(name)
+        if idx is not None:
+            self.sprite_arrays.vx[idx] = vx
+            self.sprite_arrays.vy[idx] = vy
+    
+    def integrate_sprites(self, dt: float):
+        """Advance every moving sprite by velocity * dt in one pass over the columns"""
+        arrays = self.sprite_arrays
+        xs, ys, vxs, vys = arrays.x, arrays.y, arrays.vx, arrays.vy
+        moved = []
+        for idx, sprite in enumerate(self._sprites_by_id):
+            if sprite is None:
+                continue
+            vx = vxs[idx]
+            vy = vys[idx]
+            if vx or vy:
+                xs[idx] += vx * dt
+                ys[idx] += vy * dt
+                moved.append(sprite.name)
+        if moved:
+            self._dirty.update(moved)
+            self._schedule_render()
+    
+    def move_all(self, names: List[str], dxs: List[float], dys: List[float]):
+        """Move many sprites by per-sprite deltas in one pass over the columns"""
+        xs = self.sprite_arrays.x
+        ys = self.sprite_arrays.y
+        name_to_idx = self._name_to_idx
+        moved = []
+        for name, dx, dy in zip(names, dxs, dys):
+            idx = name_to_idx.get(name)
+            if idx is not None:
+                xs[idx] += dx
+                ys[idx] += dy
+                moved.append(name)
+        if moved:
+            self._dirty.update(moved)
+            self._schedule_render()
     
     def move_sprite_to(self, name: str, x: float, y: float):
         """Move sprite to position"""
         if name in self.sprites:
             self.sprites[name].move_to(x, y)
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
     
     def change_sprite_color(self, name: str, color: str):
         """Change sprite color"""
         if name in self.sprites:
             self.sprites[name].color = color
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
     
     def change_sprite_text(self, name: str, text: str):
         """Change sprite text"""
         if name in self.sprites:
             self.sprites[name].text = text
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
+    
+    def change_sprite_layer(self, name: str, layer: int):
+        """Change sprite drawing order"""
+        if name in self.sprites and self.sprites[name].layer != layer:
+            self.sprites[name].layer = layer
+            self._set_draw_order(name, layer)
+            self._mark_dirty(name)
     
     def show_sprite(self, name: str):
         """Show sprite"""
         if name in self.sprites:
             self.sprites[name].visible = True
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
     
     def hide_sprite(self, name: str):
         """Hide sprite"""
         if name in self.sprites:
             self.sprites[name].visible = False
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            self._mark_dirty(name)
     
     def delete_sprite(self, name: str):
         """Delete sprite"""
         if name in self.sprites:
             del self.sprites[name]
-            if name in self.sprite_canvas_ids:
-                del self.sprite_canvas_ids[name]
-            if self.current_mode == "graphics":
-                self.render_sprites()
+            sprite_id = self._name_to_idx.pop(name)
+            self.sprite_arrays.release(sprite_id)
+            self._sprites_by_id[sprite_id] = None
+            self._delete_sprite_items(name)
+            key = self._order_keys.pop(name)
+            del self._draw_order[bisect_left(self._draw_order, key)]
+            self._dirty.discard(name)
+    
+    def _mark_dirty(self, name: str):
+        """Flag a sprite's canvas items for update on the next render"""
+        self._dirty.add(name)
+        self._schedule_render()
+    
+    def _delete_sprite_items(self, name: str):
+        """Remove a sprite's canvas items"""
+        for item in self.sprite_canvas_ids.pop(name, ()):
+            self.canvas.delete(item)
+    
+    def _schedule_render(self):
+        """Queue one redraw for the next idle so a burst of mutations renders once"""
+        if self.current_mode != "graphics" or self._render_pending:
+            return
+        self._render_pending = True
+        self.frame.after_idle(self._do_render)
+    
+    def _do_render(self):
+        """Run the queued redraw"""
+        self._render_pending = False
+        if self.current_mode == "graphics":
+            self.update_sprites()
+    
+    def update_sprites(self):
+        """Bring the canvas items of dirty sprites up to date"""
+        if self.is_rendering:
+            return
+        
+        self.is_rendering = True
+        
+        for name in self._dirty:
+            sprite = self.sprites.get(name)
+            if sprite is None:
+                continue
+            items = self.sprite_canvas_ids.get(name)
+            if items:
+                self._update_sprite_items(sprite, items)
+            else:
+                self.sprite_canvas_ids[name] = self._create_sprite_items(sprite)
+        self._dirty.clear()
+        
+        # Restack only when a sprite was added or its layer changed
+        if self._layer_dirty:
+            for _, _, name in self._draw_order:
+                for item in self.sprite_canvas_ids.get(name, ()):
+                    self.canvas.tag_raise(item)
+            self._layer_dirty = False
+        
+        self.is_rendering = False
     
     def render_sprites(self):
         """Render all sprites to canvas"""
@@ -295,50 +576,84 @@ class OutputWindow:
         # Clear canvas
         self.canvas.delete("all")
         
-        # Sort sprites by layer
-        sorted_sprites = sorted(self.sprites.items(), key=lambda x: x[1].layer)
-        
-        # Draw each sprite
-        for name, sprite in sorted_sprites:
-            if not sprite.visible:
-                continue
-            
-            if "circle" in sprite.tags:
-                # Draw circle
-                self.canvas.create_oval(
-                    sprite.x, sprite.y,
-                    sprite.x + sprite.width, sprite.y + sprite.height,
-                    fill=sprite.color, outline=sprite.color
-                )
-            elif "text" in sprite.tags:
-                # Draw text
-                self.canvas.create_text(
-                    sprite.x, sprite.y,
-                    text=sprite.text,
-                    fill=sprite.color,
-                    font=("Arial", 12),
-                    anchor=tk.NW
-                )
-            else:
-                # Draw rectangle
-                self.canvas.create_rectangle(
-                    sprite.x, sprite.y,
-                    sprite.x + sprite.width, sprite.y + sprite.height,
-                    fill=sprite.color, outline=sprite.color
-                )
-                
-                # Draw text if present
-                if sprite.text:
-                    self.canvas.create_text(
-                        sprite.x + sprite.width / 2,
-                        sprite.y + sprite.height / 2,
-                        text=sprite.text,
-                        fill="#ffffff",
-                        font=("Arial", 10)
-                    )
+        # Draw each sprite in layer order, keeping its item IDs for incremental updates
+        for _, _, name in self._draw_order:
+            self.sprite_canvas_ids[name] = self._create_sprite_items(self.sprites[name])
+        self._dirty.clear()
+        self._layer_dirty = False
         
         self.is_rendering = False
     
+    def _create_sprite_items(self, sprite: Sprite) -> List:
+        """Create the canvas items for a sprite and return their IDs"""
+        state = tk.NORMAL if sprite.visible else tk.HIDDEN
+        kind = sprite.kind
+        
+        if kind == Sprite.CIRCLE:
+            # Draw circle
+            return [self.canvas.create_oval(
+                sprite.x, sprite.y,
+                sprite.x + sprite.width, sprite.y + sprite.height,
+                fill=sprite.color, outline=sprite.color, state=state
+            )]
+        elif kind == Sprite.TEXT:
+            # Draw text
+            return [self.canvas.create_text(
+                sprite.x, sprite.y,
+                text=sprite.text,
+                fill=sprite.color,
+                font=("Arial", 12),
+                anchor=tk.NW,
+                state=state
+            )]
+        
+        # Draw rectangle
+        items = [self.canvas.create_rectangle(
+            sprite.x, sprite.y,
+            sprite.x + sprite.width, sprite.y + sprite.height,
+            fill=sprite.color, outline=sprite.color, state=state
+        )]
+        
+        # Draw text if present; unlabeled rectangles cost a single canvas item
+        if sprite.text:
+            items.append(self._create_label_item(sprite, state))
+        return items
+    
+    def _create_label_item(self, sprite: Sprite, state: str):
+        """Create the centered label drawn on top of a rectangle sprite"""
+        return self.canvas.create_text(
+            sprite.x + sprite.width / 2,
+            sprite.y + sprite.height / 2,
+            text=sprite.text,
+            fill="#ffffff",
+            font=("Arial", 10),
+            state=state
+        )
+    
+    def _update_sprite_items(self, sprite: Sprite, items: List):
+        """Move and restyle a sprite's existing canvas items in place"""
+        state = tk.NORMAL if sprite.visible else tk.HIDDEN
+        kind = sprite.kind
+        
+        if kind == Sprite.CIRCLE:
+            self.canvas.coords(items[0], sprite.x, sprite.y,
+                               sprite.x + sprite.width, sprite.y + sprite.height)
+            self.canvas.itemconfigure(items[0], fill=sprite.color, outline=sprite.color, state=state)
+        elif kind == Sprite.TEXT:
+            self.canvas.coords(items[0], sprite.x, sprite.y)
+            self.canvas.itemconfigure(items[0], text=sprite.text, fill=sprite.color, state=state)
+        else:
+            self.canvas.coords(items[0], sprite.x, sprite.y,
+                               sprite.x + sprite.width, sprite.y + sprite.height)
+            self.canvas.itemconfigure(items[0], fill=sprite.color, outline=sprite.color, state=state)
+            if len(items) > 1:
+                self.canvas.coords(items[1], sprite.x + sprite.width / 2, sprite.y + sprite.height / 2)
+                self.canvas.itemconfigure(items[1], text=sprite.text, state=state)
+            elif sprite.text:
+                # First label for this sprite; keep it directly above the rectangle
+                items.append(self._create_label_item(sprite, state))
+                self.canvas.tag_raise(items[1], items[0])
+    
     # ========== DRAWING PRIMITIVES ==========
     
     def draw_line(self, x1: float, y1: float, x2: float, y2: float, color: str = "#ffffff", width: int = 2):
@@ -353,7 +668,7 @@ class OutputWindow:
         
         # Draw on canvas
         self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width)
-        self.canvas.update_idletasks()
+        self._schedule_flush()
     
     def draw_rect(self, x: float, y: float, width: float, height: float, color: str = "#ffffff", filled: bool = True):
         """Draw a rectangle - ALWAYS works, auto-switches to graphics"""
@@ -369,7 +684,7 @@ class OutputWindow:
             self.canvas.create_rectangle(x, y, x + width, y + height, fill=color, outline=color)
         else:
             self.canvas.create_rectangle(x, y, x + width, y + height, outline=color, width=2)
-        self.canvas.update_idletasks()
+        self._schedule_flush()
     
     def draw_circle(self, x: float, y: float, radius: float, color: str = "#ffffff", filled: bool = True):
         """Draw a circle - ALWAYS works, auto-switches to graphics"""
@@ -387,7 +702,7 @@ class OutputWindow:
         else:
             self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius,
                                    outline=color, width=2)
-        self.canvas.update_idletasks()
+        self._schedule_flush()
     
     def draw_text(self, x: float, y: float, text: str, color: str = "#ffffff", size: int = 12):
         """Draw text - ALWAYS works, auto-switches to graphics"""
@@ -400,7 +715,7 @@ class OutputWindow:
         
         # Draw on canvas
         self.canvas.create_text(x, y, text=text, fill=color, font=("Arial", size))
-        self.canvas.update_idletasks()
+        self._schedule_flush()
     
     def fill_screen(self, color: str):
         """Fill entire screen with color - ALWAYS works, auto-switches to graphics"""
@@ -413,6 +728,22 @@ class OutputWindow:
         
         # Set background
         self.canvas.config(bg=color)
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Queue one canvas flush for the next idle instead of one per primitive"""
+        if not self._needs_flush:
+            self._needs_flush = True
+            self.canvas.after_idle(self.flush)
+    
+    def flush(self):
+        """Push pending drawing to the screen (once per logical frame)
+        
+        Also runs queued idle work such as sprite and text updates. The
+        interpreter calls this before a T# wait, so draw/wait loops paint
+        every step rather than only the final frame.
+        """
+        self._needs_flush = False
         self.canvas.update_idletasks()
     
     # ========== HELPER METHODS ==========
@@ -7,10 +7,33 @@ Text editor with T# syntax highlighting
 import tkinter as tk
 from tkinter import scrolledtext
 import re
+from bisect import bisect_right
 
 class ScriptEditor:
     """Code editor with syntax highlighting"""
     
+    # Lines highlighted per event-loop turn when retagging a whole document
+    HIGHLIGHT_CHUNK_LINES = 500
+    
+    # T# keywords
+    KEYWORDS = (
+        "var", "func", "if", "else", "while", "for", "return",
+        "true", "false", "null", "spawn", "move", "rotate",
+        "print", "input", "destroy"
+    )
+    
+    # Single master pattern, one named group per tag, compiled once when the
+    # class is defined. Every branch is bounded by the line and has no nested
+    # optional repeats, so a stray quote or a long digit run cannot make the
+    # scan backtrack
+    TOKEN_PATTERN = re.compile(
+        r'(?P<comment>//[^\n]*)'
+        r'|(?P<string>"[^"\n]*"|\'[^\'\n]*\')'
+        r'|(?P<keyword>\b(?:' + '|'.join(KEYWORDS) + r')\b)'
+        r'|(?P<number>\b\d+(?:\.\d*)?\b)'
+        r'|\b(?P<function>\w+)(?=\s*\()'
+    )
+    
     def __init__(self, parent, editor):
         self.editor = editor
         
@@ -52,9 +75,20 @@ class ScriptEditor:
         # Configure syntax highlighting tags
         self.setup_syntax_tags()
         
+        # Pending debounced highlight (after() job id)
+        self._highlight_job = None
+        # Line range touched by edits since the last highlight, and the
+        # insert line before the most recent edit
+        self._dirty_lines = None
+        self._last_insert_line = 1
+        # Pending chunk of a whole-document highlight (after_idle job id)
+        self._chunk_job = None
+        # Number of lines currently shown in the line-number gutter
+        self._line_count = 0
+        
         # Bind events
+        self.text_widget.bind("<<Modified>>", self.on_modified)
         self.text_widget.bind("<KeyRelease>", self.on_key_release)
-        self.text_widget.bind("<MouseWheel>", self.on_scroll)
         self.text_widget.bind("<Button-1>", self.on_click)
         
         # Initial line numbers
@@ -75,75 +109,140 @@ class ScriptEditor:
         # Operators
         self.text_widget.tag_config("operator", foreground="#d4d4d4")
     
-    def highlight_syntax(self):
-        """Apply syntax highlighting to the text"""
-        content = self.text_widget.get("1.0", tk.END)
+    def highlight_syntax(self, first="1.0", last=tk.END):
+        """Apply syntax highlighting to the text between two indices"""
+        content = self.text_widget.get(first, last)
         
         # Remove all tags
         for tag in ["keyword", "string", "comment", "number", "function", "operator"]:
-            self.text_widget.tag_remove(tag, "1.0", tk.END)
+            self.text_widget.tag_remove(tag, first, last)
         
-        # Keywords
-        keywords = [
-            "var", "func", "if", "else", "while", "for", "return",
-            "true", "false", "null", "spawn", "move", "rotate",
-            "print", "input", "destroy"
-        ]
-        
-        for keyword in keywords:
-            pattern = r'\b' + keyword + r'\b'
-            for match in re.finditer(pattern, content):
-                start = f"1.0+{match.start()}c"
-                end = f"1.0+{match.end()}c"
-                self.text_widget.tag_add("keyword", start, end)
-        
-        # Strings (single and double quotes)
-        for match in re.finditer(r'["\'].*?["\']', content):
-            start = f"1.0+{match.start()}c"
-            end = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("string", start, end)
+        # Offsets of each line start, so match positions map to "line.col"
+        # without making Tk count characters from the start index
+        first_line, first_col = map(int, self.text_widget.index(first).split('.'))
+        offsets = self.line_offsets(content)
         
-        # Comments
-        for match in re.finditer(r'//.*?$', content, re.MULTILINE):
-            start = f"1.0+{match.start()}c"
-            end = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("comment", start, end)
+        def to_index(pos):
+            row = bisect_right(offsets, pos) - 1
+            col = pos - offsets[row]
+            if row == 0:
+                col += first_col
+            return f"{first_line + row}.{col}"
         
-        # Numbers
-        for match in re.finditer(r'\b\d+\.?\d*\b', content):
-            start = f"1.0+{match.start()}c"
-            end = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("number", start, end)
+        # One pass over the text; the group name is the tag to apply
+        ranges = {tag: [] for tag in self.TOKEN_PATTERN.groupindex}
+        for match in self.TOKEN_PATTERN.finditer(content):
+            tag = match.lastgroup
+            ranges[tag].extend((to_index(match.start(tag)), to_index(match.end(tag))))
         
-        # Functions
-        for match in re.finditer(r'\b(\w+)\s*\(', content):
-            start = f"1.0+{match.start(1)}c"
-            end = f"1.0+{match.end(1)}c"
-            self.text_widget.tag_add("function", start, end)
+        # Tk's "tag add" is variadic, so one call tags every match of a tag
+        for tag, indices in ranges.items():
+            if indices:
+                self.text_widget.tag_add(tag, *indices)
     
-    def update_line_numbers(self):
-        """Update line numbers display"""
-        self.line_numbers.config(state=tk.NORMAL)
-        self.line_numbers.delete("1.0", tk.END)
+    @staticmethod
+    def line_offsets(content):
+        """Return the character offset at which each line of content starts"""
+        offsets = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        return offsets
+    
+    def highlight_all(self):
+        """Highlight the whole document in line-aligned chunks
         
-        line_count = int(self.text_widget.index(tk.END).split('.')[0]) - 1
-        line_numbers_text = "\n".join(str(i) for i in range(1, line_count + 1))
+        No token spans a line break, so chunks split at line boundaries need
+        no overlap. Each chunk runs in its own event-loop turn, which keeps
+        the editor responsive while a large script is being tagged.
+        """
+        if self._chunk_job:
+            self.text_widget.after_cancel(self._chunk_job)
+            self._chunk_job = None
+        self._highlight_chunk(1)
+    
+    def _highlight_chunk(self, first_line):
+        """Highlight one chunk and queue the next"""
+        total_lines = int(self.text_widget.index("end-1c").split('.')[0])
+        last_line = min(first_line + self.HIGHLIGHT_CHUNK_LINES - 1, total_lines)
+        self.highlight_syntax(f"{first_line}.0", f"{last_line}.end")
+        if last_line < total_lines:
+            self._chunk_job = self.text_widget.after_idle(self._highlight_chunk, last_line + 1)
+        else:
+            self._chunk_job = None
+    
+    def update_line_numbers(self, line_count=None):
+        """Update line numbers display, touching only lines added or removed
+        
+        Callers that already hold the text can pass its line count so Tk is
+        not asked for the end index.
+        """
+        if line_count is None:
+            line_count = int(self.text_widget.index("end-1c").split('.')[0])
+        old_count = self._line_count
+        if line_count == old_count:
+            return
         
-        self.line_numbers.insert("1.0", line_numbers_text)
+        self.line_numbers.config(state=tk.NORMAL)
+        if line_count > old_count:
+            new_numbers = "\n".join(str(i) for i in range(old_count + 1, line_count + 1))
+            self.line_numbers.insert(tk.END, ("\n" if old_count else "") + new_numbers)
+        else:
+            self.line_numbers.delete(f"{line_count}.end", tk.END)
         self.line_numbers.config(state=tk.DISABLED)
+        
+        self._line_count = line_count
     
-    def on_key_release(self, event=None):
-        """Handle key release events"""
-        self.update_line_numbers()
-        self.highlight_syntax()
+    def schedule_highlight(self, delay=40):
+        """Debounce highlighting so a burst of keystrokes retags only once"""
+        if self._highlight_job:
+            self.text_widget.after_cancel(self._highlight_job)
+        self._highlight_job = self.text_widget.after(delay, self._highlight_dirty)
     
-    def on_scroll(self, event=None):
-        """Sync line numbers scrolling"""
+    def _insert_line(self):
+        """Line number of the insert cursor"""
+        return int(self.text_widget.index(tk.INSERT).split('.')[0])
+    
+    def _highlight_dirty(self):
+        """Retag only the lines touched since the last highlight"""
+        self._highlight_job = None
+        if self._dirty_lines is None:
+            return
+        first_line, last_line = self._dirty_lines
+        self._dirty_lines = None
+        self.highlight_syntax(f"{first_line}.0", f"{last_line}.end")
+    
+    def on_modified(self, event=None):
+        """Record the edited line range and queue a highlight for it"""
+        # Resetting the flag below fires <<Modified>> again; ignore that one
+        if not self.text_widget.edit_modified():
+            return
+        self.text_widget.edit_modified(False)
+        
+        # The edit spans from where the cursor was to where it is now;
+        # widen a little so tokens next to the edit are rescanned too
+        line = self._insert_line()
+        first_line = max(1, min(line, self._last_insert_line) - 2)
+        last_line = max(line, self._last_insert_line) + 2
+        if self._dirty_lines is not None:
+            first_line = min(first_line, self._dirty_lines[0])
+            last_line = max(last_line, self._dirty_lines[1])
+        self._dirty_lines = (first_line, last_line)
+        self._last_insert_line = line
         self.update_line_numbers()
+        self.schedule_highlight()
+    
+    def on_key_release(self, event=None):
+        """Handle key release events"""
+        self._last_insert_line = self._insert_line()
     
     def on_click(self, event=None):
         """Handle click events"""
-        self.update_line_numbers()
+        # Runs before the class binding moves the cursor, so use the click point
+        if event is not None:
+            clicked = self.text_widget.index(f"@{event.x},{event.y}")
+            self._last_insert_line = int(clicked.split('.')[0])
     
     def get_content(self):
         """Get the editor content"""
@@ -153,15 +252,25 @@ class ScriptEditor:
         """Set the editor content"""
         self.text_widget.delete("1.0", tk.END)
         self.text_widget.insert("1.0", content)
-        self.highlight_syntax()
-        self.update_line_numbers()
+        # Full rehighlight; the pending <<Modified>> is then a no-op
+        self.highlight_all()
+        self.text_widget.edit_modified(False)
+        self._dirty_lines = None
+        self._last_insert_line = self._insert_line()
+        self.update_line_numbers(content.count("\n") + 1)
     
     def save(self, filepath):
-        """Save content to file"""
-        content = self.get_content()
+        """Save content to file
+        
+        The text is streamed from the widget in the segments dump() returns
+        (split at tag boundaries) through a 1 MiB write buffer, so the whole
+        document is never copied into one string.
+        """
         try:
-            with open(filepath, 'w') as f:
-                f.write(content)
+            with open(filepath, 'w', buffering=1 << 20) as f:
+                for key, value, _ in self.text_widget.dump("1.0", tk.END, text=True):
+                    if key == "text":
+                        f.write(value)
             return True
         except Exception as e:
             self.editor.log(f"Error saving file: {e}", "error")
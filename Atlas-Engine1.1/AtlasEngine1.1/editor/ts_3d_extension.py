@@ -5,42 +5,124 @@ Adds 100+ 3D game engine commands to T#
 """
 
 import re
+import sys
 from typing import Optional, List, Dict, Any
 
+from editor.viewport_3d import Vector3D, Cube, Sphere
+
 class TS3DExtension:
     """Extension class for 3D viewport integration with T#"""
     
+    # Command patterns, compiled once at import
+    CREATE3D_PATTERN = re.compile(r'^create3d\s+(\w+)\s+at\s+([^,]+),\s*([^,]+),\s*([^,]+?)(?:\s+size\s+([^,]+?))?\s*$', re.I)
+    MOVE3D_PATTERN = re.compile(r'^move3d\s+(\w+)\s+to\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    ROTATE3D_PATTERN = re.compile(r'^rotate3d\s+(\w+)\s+to\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    SCALE3D_PATTERN = re.compile(r'^scale3d\s+(\w+)\s+to\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    COLOR3D_PATTERN = re.compile(r'^color3d\s+(\w+)\s+to\s+["\']([^"\']+)["\']\s*$', re.I)
+    DELETE3D_PATTERN = re.compile(r'^delete3d\s+(\w+)\s*$', re.I)
+    PHYSICS3D_PATTERN = re.compile(r'^physics3d\s+(on|off)\s+(\w+)\s*$', re.I)
+    COLLISION3D_PATTERN = re.compile(r'^collision3d\s+(on|off)\s+(\w+)\s*$', re.I)
+    VELOCITY3D_PATTERN = re.compile(r'^velocity3d\s+(\w+)\s+to\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    CAMERA_PATTERN = re.compile(r'^camera\s+at\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    LOOKAT_PATTERN = re.compile(r'^lookat\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    FOV_PATTERN = re.compile(r'^fov\s+(\S.*)$', re.I)
+    SKYBOX_PATTERN = re.compile(r'^skybox\s+["\']([^"\']+)["\']\s*$', re.I)
+    GROUND_PATTERN = re.compile(r'^ground\s+at\s+([^"\']+?)\s+color\s+["\']([^"\']+)["\']\s+size\s+(\S.*)$', re.I)
+    PLATFORM_PATTERN = re.compile(r'^platform\s+at\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s+size\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    PLAYER_PATTERN = re.compile(r'^player\s+at\s+([^,]+),\s*([^,]+),\s*([^,]+?)\s*$', re.I)
+    SPEED_PATTERN = re.compile(r'^speed\s+is\s+(\S.*)$', re.I)
+    JUMP_PATTERN = re.compile(r'^jump(?:\s+force\s+(\S.*))?$', re.I)
+    HEALTH_PATTERN = re.compile(r'^health\s+(is|add|subtract)\s+(\S.*)$', re.I)
+    CROSSHAIR_COLOR_PATTERN = re.compile(r'^crosshair\s+color\s+["\']([^"\']+)["\']\s*$', re.I)
+    MESSAGE_PATTERN = re.compile(r'^message\s+["\'](.+?)["\']\s+duration\s+(\S.*)$', re.I)
+    NPC_PATTERN = re.compile(r'^npc\s+["\']([^"\']+)["\']\s+at\s+([^,]+),\s*([^,]+),\s*([^,]+?)(?:\s+color\s+["\']([^"\']+)["\'])?\s*$', re.I)
+    DIALOGUE_PATTERN = re.compile(r'^dialogue\s+["\']([^"\']+)["\']\s+says\s+["\'](.+)["\']\s*$', re.I)
+    TALK_PATTERN = re.compile(r'^talk\s+to\s+["\']([^"\']+)["\']\s*$', re.I)
+    SAY_NPC_PATTERN = re.compile(r'^say\s+as\s+["\']([^"\']+)["\']\s+["\'](.+)["\']\s*$', re.I)
+    
+    # Plain numeric literal, converted without going through eval_expr
+    NUMBER_PATTERN = re.compile(r'[-+]?\d+(?:\.\d*)?$')
+    
     def __init__(self, interpreter, editor):
         self.interpreter = interpreter
         self.editor = editor
         self.viewport = None
         self.last_created_object = None
         self.named_objects = {}
+        # Set by commands that change the scene; flush() renders once for all
+        self._needs_render = False
+        # Command keyword -> handler, built once so dispatch is one dict lookup
+        self._dispatch = self.get_command_methods()
+        
+    def has_command(self, cmd: str) -> bool:
+        """Check whether a (lowercased) command keyword is a 3D command"""
+        return cmd in self._dispatch
+    
+    def dispatch(self, stmt: str, cmd: Optional[str] = None):
+        """Run the handler for a statement's command keyword
         
+        Only the matching handler parses the statement. Callers that have
+        already split off the lowercased keyword can pass it as cmd.
+        """
+        if cmd is None:
+            words = stmt.split(None, 1)
+            if not words:
+                return None
+            cmd = words[0].lower()
+        handler = self._dispatch.get(cmd)
+        return handler(stmt) if handler else None
+    
     def get_viewport(self):
         """Get 3D viewport reference"""
         if not self.viewport and hasattr(self.editor, 'viewport_3d'):
             self.viewport = self.editor.viewport_3d
         return self.viewport
     
+    def flush(self):
+        """Render the viewport if any command changed the scene since the
+        last flush, so a burst of commands costs a single render"""
+        if not self._needs_render:
+            return
+        self._needs_render = False
+        vp = self.get_viewport()
+        if vp:
+            vp.render()
+    
+    def _info(self, message: str, *args):
+        """Log an informational message, formatting it only when the
+        interpreter is verbose
+        
+        message is a str.format template filled from args, so callers do no
+        string work when informational logs are turned off.
+        """
+        if self.interpreter.verbose:
+            self.interpreter.log(message.format(*args) if args else message)
+    
+    def _num(self, text: str):
+        """Evaluate a numeric argument, skipping eval_expr for plain literals
+        
+        Literals give the same int/float result eval_expr would; anything
+        else (variables, arithmetic) is passed to the interpreter.
+        """
+        text = text.strip()
+        if self.NUMBER_PATTERN.match(text):
+            return float(text) if '.' in text else int(text)
+        return self.interpreter.eval_expr(text)
+    
     # ==================== 3D OBJECT COMMANDS ====================
     
     def cmd_create3d(self, stmt: str):
         """create3d type at x, y, z size scale"""
-        match = re.match(
-            r'create3d\s+(\w+)\s+at\s+(.+?),\s*(.+?),\s*(.+?)(?:\s+size\s+(.+?))?',
-            stmt, re.I
-        )
+        match = self.CREATE3D_PATTERN.match(stmt)
         if match:
             obj_type = match.group(1).lower()
-            x = self.interpreter.eval_expr(match.group(2))
-            y = self.interpreter.eval_expr(match.group(3))
-            z = self.interpreter.eval_expr(match.group(4))
-            size = float(self.interpreter.eval_expr(match.group(5))) if match.group(5) else 1.0
+            x = self._num(match.group(2))
+            y = self._num(match.group(3))
+            z = self._num(match.group(4))
+            size = float(self._num(match.group(5))) if match.group(5) else 1.0
             
             vp = self.get_viewport()
             if vp:
-                from editor.viewport_3d import Vector3D, Cube, Sphere
                 pos = Vector3D(x, y, z)
                 
                 if obj_type == 'cube':
@@ -54,65 +136,62 @@ class TS3DExtension:
                 vp.shapes.append(obj)
                 self.last_created_object = obj
                 self.interpreter.variables['last3d'] = obj
-                vp.render()
-                self.interpreter.log(f"🎮 Created 3D {obj_type} at ({x}, {y}, {z})")
+                self._needs_render = True
+                self._info("🎮 Created 3D {} at ({}, {}, {})", obj_type, x, y, z)
     
     def cmd_move3d(self, stmt: str):
         """move3d object to x, y, z"""
-        match = re.match(r'move3d\s+(\w+)\s+to\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.MOVE3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
-            x = self.interpreter.eval_expr(match.group(2))
-            y = self.interpreter.eval_expr(match.group(3))
-            z = self.interpreter.eval_expr(match.group(4))
+            obj_name = sys.intern(match.group(1))
+            x = self._num(match.group(2))
+            y = self._num(match.group(3))
+            z = self._num(match.group(4))
             
             obj = self.interpreter.variables.get(obj_name)
             if obj and hasattr(obj, 'position'):
-                from editor.viewport_3d import Vector3D
-                obj.position = Vector3D(x, y, z)
+                obj.position.set(x, y, z)
                 vp = self.get_viewport()
                 if vp:
-                    vp.render()
+                    self._needs_render = True
     
     def cmd_rotate3d(self, stmt: str):
         """rotate3d object to pitch, yaw, roll"""
-        match = re.match(r'rotate3d\s+(\w+)\s+to\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.ROTATE3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
-            pitch = self.interpreter.eval_expr(match.group(2))
-            yaw = self.interpreter.eval_expr(match.group(3))
-            roll = self.interpreter.eval_expr(match.group(4))
+            obj_name = sys.intern(match.group(1))
+            pitch = self._num(match.group(2))
+            yaw = self._num(match.group(3))
+            roll = self._num(match.group(4))
             
             obj = self.interpreter.variables.get(obj_name)
             if obj and hasattr(obj, 'rotation'):
-                from editor.viewport_3d import Vector3D
-                obj.rotation = Vector3D(pitch, yaw, roll)
+                obj.rotation.set(pitch, yaw, roll)
                 vp = self.get_viewport()
                 if vp:
-                    vp.render()
+                    self._needs_render = True
     
     def cmd_scale3d(self, stmt: str):
         """scale3d object to sx, sy, sz"""
-        match = re.match(r'scale3d\s+(\w+)\s+to\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.SCALE3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
-            sx = self.interpreter.eval_expr(match.group(2))
-            sy = self.interpreter.eval_expr(match.group(3))
-            sz = self.interpreter.eval_expr(match.group(4))
+            obj_name = sys.intern(match.group(1))
+            sx = self._num(match.group(2))
+            sy = self._num(match.group(3))
+            sz = self._num(match.group(4))
             
             obj = self.interpreter.variables.get(obj_name)
             if obj and hasattr(obj, 'scale'):
-                from editor.viewport_3d import Vector3D
-                obj.scale = Vector3D(sx, sy, sz)
+                obj.scale.set(sx, sy, sz)
                 vp = self.get_viewport()
                 if vp:
-                    vp.render()
+                    self._needs_render = True
     
     def cmd_color3d(self, stmt: str):
         """color3d object to "color" """
-        match = re.match(r'color3d\s+(\w+)\s+to\s+["\'](.+?)["\']', stmt, re.I)
+        match = self.COLOR3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
+            obj_name = sys.intern(match.group(1))
             color = match.group(2)
             
             obj = self.interpreter.variables.get(obj_name)
@@ -120,135 +199,127 @@ class TS3DExtension:
                 obj.color = color
                 vp = self.get_viewport()
                 if vp:
-                    vp.render()
+                    self._needs_render = True
     
     def cmd_delete3d(self, stmt: str):
         """delete3d object"""
-        match = re.match(r'delete3d\s+(\w+)', stmt, re.I)
+        match = self.DELETE3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
+            obj_name = sys.intern(match.group(1))
             obj = self.interpreter.variables.get(obj_name)
             
             vp = self.get_viewport()
             if obj and vp:
-                if obj in vp.shapes:
-                    vp.shapes.remove(obj)
-                    vp.render()
-                    self.interpreter.log(f"🗑️ Deleted 3D object")
+                if vp.shapes.discard(obj):
+                    self._needs_render = True
+                    self._info("🗑️ Deleted 3D object")
     
     def cmd_physics3d(self, stmt: str):
         """physics3d on/off object"""
-        match = re.match(r'physics3d\s+(on|off)\s+(\w+)', stmt, re.I)
+        match = self.PHYSICS3D_PATTERN.match(stmt)
         if match:
             state = match.group(1).lower()
-            obj_name = match.group(2)
+            obj_name = sys.intern(match.group(2))
             obj = self.interpreter.variables.get(obj_name)
             
             if obj and hasattr(obj, 'has_physics'):
                 obj.has_physics = (state == 'on')
-                self.interpreter.log(f"⚙️ Physics {state} for object")
+                self._info("⚙️ Physics {} for object", state)
     
     def cmd_collision3d(self, stmt: str):
         """collision3d on/off object"""
-        match = re.match(r'collision3d\s+(on|off)\s+(\w+)', stmt, re.I)
+        match = self.COLLISION3D_PATTERN.match(stmt)
         if match:
             state = match.group(1).lower()
-            obj_name = match.group(2)
+            obj_name = sys.intern(match.group(2))
             obj = self.interpreter.variables.get(obj_name)
             
             if obj and hasattr(obj, 'has_collision'):
                 obj.has_collision = (state == 'on')
-                self.interpreter.log(f"🛡️ Collision {state} for object")
+                self._info("🛡️ Collision {} for object", state)
     
     def cmd_velocity3d(self, stmt: str):
         """velocity3d object to vx, vy, vz"""
-        match = re.match(r'velocity3d\s+(\w+)\s+to\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.VELOCITY3D_PATTERN.match(stmt)
         if match:
-            obj_name = match.group(1)
-            vx = self.interpreter.eval_expr(match.group(2))
-            vy = self.interpreter.eval_expr(match.group(3))
-            vz = self.interpreter.eval_expr(match.group(4))
+            obj_name = sys.intern(match.group(1))
+            vx = self._num(match.group(2))
+            vy = self._num(match.group(3))
+            vz = self._num(match.group(4))
             
             obj = self.interpreter.variables.get(obj_name)
             if obj and hasattr(obj, 'velocity'):
-                from editor.viewport_3d import Vector3D
-                obj.velocity = Vector3D(vx, vy, vz)
+                obj.velocity.set(vx, vy, vz)
     
     # ==================== CAMERA COMMANDS ====================
     
     def cmd_camera(self, stmt: str):
         """camera at x, y, z"""
-        match = re.match(r'camera\s+at\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.CAMERA_PATTERN.match(stmt)
         if match:
-            x = self.interpreter.eval_expr(match.group(1))
-            y = self.interpreter.eval_expr(match.group(2))
-            z = self.interpreter.eval_expr(match.group(3))
+            x = self._num(match.group(1))
+            y = self._num(match.group(2))
+            z = self._num(match.group(3))
             
             vp = self.get_viewport()
             if vp:
-                from editor.viewport_3d import Vector3D
                 vp.camera_pos = Vector3D(x, y, z)
-                vp.render()
-                self.interpreter.log(f"📷 Camera at ({x}, {y}, {z})")
+                self._needs_render = True
+                self._info("📷 Camera at ({}, {}, {})", x, y, z)
     
     def cmd_lookat(self, stmt: str):
         """lookat x, y, z"""
-        match = re.match(r'lookat\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.LOOKAT_PATTERN.match(stmt)
         if match:
-            x = self.interpreter.eval_expr(match.group(1))
-            y = self.interpreter.eval_expr(match.group(2))
-            z = self.interpreter.eval_expr(match.group(3))
+            x = self._num(match.group(1))
+            y = self._num(match.group(2))
+            z = self._num(match.group(3))
             
             vp = self.get_viewport()
             if vp:
-                from editor.viewport_3d import Vector3D
                 vp.camera_target = Vector3D(x, y, z)
-                vp.render()
+                self._needs_render = True
     
     def cmd_firstperson(self, stmt: str):
         """firstperson"""
         vp = self.get_viewport()
         if vp:
             vp.player_controls_enabled = True
-            self.interpreter.log("🎮 First-person mode enabled")
+            self._info("🎮 First-person mode enabled")
     
     def cmd_thirdperson(self, stmt: str):
         """thirdperson"""
         vp = self.get_viewport()
         if vp:
             vp.player_controls_enabled = False
-            self.interpreter.log("🎮 Third-person mode")
+            self._info("🎮 Third-person mode")
     
     def cmd_fov(self, stmt: str):
         """fov degrees"""
-        match = re.match(r'fov\s+(.+)', stmt, re.I)
+        match = self.FOV_PATTERN.match(stmt)
         if match:
-            fov = self.interpreter.eval_expr(match.group(1))
+            fov = self._num(match.group(1))
             # Would set FOV on viewport
-            self.interpreter.log(f"🎥 FOV set to {fov}")
+            self._info("🎥 FOV set to {}", fov)
     
     # ==================== WORLD COMMANDS ====================
     
     def cmd_skybox(self, stmt: str):
         """skybox "type" """
-        match = re.match(r'skybox\s+["\'](.+?)["\']', stmt, re.I)
+        match = self.SKYBOX_PATTERN.match(stmt)
         if match:
             skybox_type = match.group(1)
-            self.interpreter.log(f"🌅 Skybox: {skybox_type}")
+            self._info("🌅 Skybox: {}", skybox_type)
     
     def cmd_ground(self, stmt: str):
         """ground at y color "color" size s"""
-        match = re.match(
-            r'ground\s+at\s+(.+?)\s+color\s+["\'](.+?)["\']\s+size\s+(.+)',
-            stmt, re.I
-        )
+        match = self.GROUND_PATTERN.match(stmt)
         if match:
-            y = self.interpreter.eval_expr(match.group(1))
+            y = self._num(match.group(1))
             color = match.group(2)
-            size = self.interpreter.eval_expr(match.group(3))
+            size = self._num(match.group(3))
             
             # Create large plane
-            from editor.viewport_3d import Vector3D, Cube
             vp = self.get_viewport()
             if vp:
                 ground = Cube(Vector3D(0, y, 0), size)
@@ -257,24 +328,20 @@ class TS3DExtension:
                 ground.is_static = True
                 ground.has_collision = True
                 vp.shapes.append(ground)
-                vp.render()
-                self.interpreter.log(f"🟩 Created ground")
+                self._needs_render = True
+                self._info("🟩 Created ground")
     
     def cmd_platform(self, stmt: str):
         """platform at x, y, z size w, h, d"""
-        match = re.match(
-            r'platform\s+at\s+(.+?),\s*(.+?),\s*(.+?)\s+size\s+(.+?),\s*(.+?),\s*(.+)',
-            stmt, re.I
-        )
+        match = self.PLATFORM_PATTERN.match(stmt)
         if match:
-            x = self.interpreter.eval_expr(match.group(1))
-            y = self.interpreter.eval_expr(match.group(2))
-            z = self.interpreter.eval_expr(match.group(3))
-            w = self.interpreter.eval_expr(match.group(4))
-            h = self.interpreter.eval_expr(match.group(5))
-            d = self.interpreter.eval_expr(match.group(6))
+            x = self._num(match.group(1))
+            y = self._num(match.group(2))
+            z = self._num(match.group(3))
+            w = self._num(match.group(4))
+            h = self._num(match.group(5))
+            d = self._num(match.group(6))
             
-            from editor.viewport_3d import Vector3D, Cube
             vp = self.get_viewport()
             if vp:
                 platform = Cube(Vector3D(x, y, z), 1)
@@ -283,97 +350,95 @@ class TS3DExtension:
                 vp.shapes.append(platform)
                 self.last_created_object = platform
                 self.interpreter.variables['last3d'] = platform
-                vp.render()
-                self.interpreter.log(f"🟦 Created platform")
+                self._needs_render = True
+                self._info("🟦 Created platform")
     
     # ==================== PLAYER COMMANDS ====================
     
     def cmd_player(self, stmt: str):
         """player at x, y, z"""
-        match = re.match(r'player\s+at\s+(.+?),\s*(.+?),\s*(.+)', stmt, re.I)
+        match = self.PLAYER_PATTERN.match(stmt)
         if match:
-            x = self.interpreter.eval_expr(match.group(1))
-            y = self.interpreter.eval_expr(match.group(2))
-            z = self.interpreter.eval_expr(match.group(3))
+            x = self._num(match.group(1))
+            y = self._num(match.group(2))
+            z = self._num(match.group(3))
             
             vp = self.get_viewport()
             if vp:
-                from editor.viewport_3d import Vector3D
                 vp.camera_pos = Vector3D(x, y, z)
                 vp.player_controls_enabled = True
-                vp.render()
-                self.interpreter.log(f"👤 Player created at ({x}, {y}, {z})")
+                self._needs_render = True
+                self._info("👤 Player created at ({}, {}, {})", x, y, z)
     
     def cmd_speed(self, stmt: str):
         """speed is value"""
-        match = re.match(r'speed\s+is\s+(.+)', stmt, re.I)
+        match = self.SPEED_PATTERN.match(stmt)
         if match:
-            speed = self.interpreter.eval_expr(match.group(1))
+            speed = self._num(match.group(1))
             vp = self.get_viewport()
             if vp:
                 vp.move_speed = float(speed)
-                self.interpreter.log(f"⚡ Speed set to {speed}")
+                self._info("⚡ Speed set to {}", speed)
     
     def cmd_jump(self, stmt: str):
         """jump or jump force f"""
-        match = re.match(r'jump(?:\s+force\s+(.+))?', stmt, re.I)
+        match = self.JUMP_PATTERN.match(stmt)
         force = 10.0
         if match and match.group(1):
-            force = self.interpreter.eval_expr(match.group(1))
+            force = self._num(match.group(1))
         
         vp = self.get_viewport()
         if vp:
             # Apply upward velocity
             vp.player_velocity_y = float(force)
-            self.interpreter.log(f"🦘 Jump!")
+            self._info("🦘 Jump!")
     
     def cmd_health(self, stmt: str):
         """health is/add/subtract value"""
-        if 'add' in stmt:
-            match = re.match(r'health\s+add\s+(.+)', stmt, re.I)
-            if match:
-                amount = self.interpreter.eval_expr(match.group(1))
-                if 'player_health' in self.interpreter.variables:
-                    self.interpreter.variables['player_health'] += amount
-        elif 'subtract' in stmt:
-            match = re.match(r'health\s+subtract\s+(.+)', stmt, re.I)
-            if match:
-                amount = self.interpreter.eval_expr(match.group(1))
-                if 'player_health' in self.interpreter.variables:
-                    self.interpreter.variables['player_health'] -= amount
-        else:
-            match = re.match(r'health\s+is\s+(.+)', stmt, re.I)
-            if match:
-                value = self.interpreter.eval_expr(match.group(1))
-                self.interpreter.variables['player_health'] = value
+        match = self.HEALTH_PATTERN.match(stmt)
+        if match:
+            operation = match.group(1).lower()
+            value = self._num(match.group(2))
+            variables = self.interpreter.variables
+            if operation == 'is':
+                variables['player_health'] = value
+            elif 'player_health' in variables:
+                if operation == 'add':
+                    variables['player_health'] += value
+                else:
+                    variables['player_health'] -= value
     
     # ==================== UI COMMANDS ====================
     
     def cmd_hud(self, stmt: str):
         """hud show/hide"""
-        if 'show' in stmt.lower():
-            self.interpreter.log("📊 HUD shown")
-        elif 'hide' in stmt.lower():
-            self.interpreter.log("📊 HUD hidden")
+        words = stmt.split(None, 2)
+        option = words[1].lower() if len(words) > 1 else ''
+        if option == 'show':
+            self._info("📊 HUD shown")
+        elif option == 'hide':
+            self._info("📊 HUD hidden")
     
     def cmd_crosshair(self, stmt: str):
         """crosshair show/hide/color"""
-        if 'show' in stmt.lower():
-            self.interpreter.log("🎯 Crosshair shown")
-        elif 'hide' in stmt.lower():
-            self.interpreter.log("🎯 Crosshair hidden")
-        elif 'color' in stmt.lower():
-            match = re.match(r'crosshair\s+color\s+["\'](.+?)["\']', stmt, re.I)
+        words = stmt.split(None, 2)
+        option = words[1].lower() if len(words) > 1 else ''
+        if option == 'show':
+            self._info("🎯 Crosshair shown")
+        elif option == 'hide':
+            self._info("🎯 Crosshair hidden")
+        elif option == 'color':
+            match = self.CROSSHAIR_COLOR_PATTERN.match(stmt)
             if match:
                 color = match.group(1)
-                self.interpreter.log(f"🎯 Crosshair color: {color}")
+                self._info("🎯 Crosshair color: {}", color)
     
     def cmd_message(self, stmt: str):
         """message "text" duration d"""
-        match = re.match(r'message\s+["\'](.+?)["\']\s+duration\s+(.+)', stmt, re.I)
+        match = self.MESSAGE_PATTERN.match(stmt)
         if match:
             text = match.group(1)
-            duration = self.interpreter.eval_expr(match.group(2))
+            duration = self._num(match.group(2))
             
             # Display in output window
             if hasattr(self.interpreter.editor, 'output_window'):
@@ -383,23 +448,23 @@ class TS3DExtension:
     
     def cmd_npc(self, stmt: str):
         """npc "name" at x, y, z"""
-        match = re.match(r'npc\s+["\'](.+?)["\']\s+at\s+(.+?),\s*(.+?),\s*(.+?)(?:\s+color\s+["\'](.+?)["\'])?', stmt, re.I)
+        match = self.NPC_PATTERN.match(stmt)
         if match:
             name = match.group(1)
-            x = self.interpreter.eval_expr(match.group(2))
-            y = self.interpreter.eval_expr(match.group(3))
-            z = self.interpreter.eval_expr(match.group(4))
+            x = self._num(match.group(2))
+            y = self._num(match.group(3))
+            z = self._num(match.group(4))
             color = match.group(5) if match.group(5) else "#9900ff"  # Purple default
             
             vp = self.get_viewport()
             if vp:
                 npc = vp.add_npc(name, x, y, z, color)
-                self.interpreter.variables[name.lower()] = npc
-                self.interpreter.log(f"👤 Created NPC '{name}'")
+                self.interpreter.variables[sys.intern(name.lower())] = npc
+                self._info("👤 Created NPC '{}'", name)
     
     def cmd_dialogue(self, stmt: str):
         """dialogue "name" says "text" """
-        match = re.match(r'dialogue\s+["\'](.+?)["\']\s+says\s+["\'](.+?)["\']', stmt, re.I)
+        match = self.DIALOGUE_PATTERN.match(stmt)
         if match:
             npc_name = match.group(1)
             text = match.group(2)
@@ -407,11 +472,11 @@ class TS3DExtension:
             vp = self.get_viewport()
             if vp:
                 vp.add_npc_dialogue(npc_name, text)
-                self.interpreter.log(f"💬 Added dialogue to {npc_name}")
+                self._info("💬 Added dialogue to {}", npc_name)
     
     def cmd_talk(self, stmt: str):
         """talk to "name" """
-        match = re.match(r'talk\s+to\s+["\'](.+?)["\']', stmt, re.I)
+        match = self.TALK_PATTERN.match(stmt)
         if match:
             npc_name = match.group(1)
             
@@ -421,7 +486,7 @@ class TS3DExtension:
     
     def cmd_say_npc(self, stmt: str):
         """say as "name" "text" """
-        match = re.match(r'say\s+as\s+["\'](.+?)["\']\s+["\'](.+?)["\']', stmt, re.I)
+        match = self.SAY_NPC_PATTERN.match(stmt)
         if match:
             npc_name = match.group(1)
             text = match.group(2)
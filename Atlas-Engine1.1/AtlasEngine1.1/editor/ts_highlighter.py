@@ -5,6 +5,14 @@ Provides syntax highlighting for the T# scripting language
 """
 
 import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+# Token spans stored column-wise: parallel arrays of start/end offsets and
+# type ids (indexes into TSHighlighter.TOKEN_TYPES), plus the source they
+# index into
+Tokens = namedtuple('Tokens', ['starts', 'ends', 'type_ids', 'source'])
 
 class TSHighlighter:
     """T# Syntax Highlighter"""
@@ -27,70 +35,164 @@ class TSHighlighter:
         '&&', '||', '!', '&', '|', '^', '~', '<<', '>>'
     ]
     
+    # Token type names; tokenize_spans() reports a type as its index here
+    TOKEN_TYPES = ('comment', 'string', 'number', 'keyword', 'type', 'function', 'operator')
+    TOKEN_TYPE_IDS = {name: i for i, name in enumerate(TOKEN_TYPES)}
+    
+    # Word lookups for the identifier branch of the master pattern
+    KEYWORD_SET = frozenset(KEYWORDS)
+    TYPE_SET = frozenset(TYPES)
+    
+    # Brackets to balance, plus the comments and strings they may hide in
+    BRACKET_PATTERN = re.compile(
+        r'//[^\n]*|/\*.*?\*/|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[{}()]',
+        re.DOTALL
+    )
+    
+    # Regex source for each token type, ordered by precedence: comments and
+    # strings come first so keywords, numbers and operators inside them are
+    # not reported separately. Built once, when the class is defined
+    TOKEN_PATTERNS = {
+        'comment': r'//.*?$|/\*.*?\*/',
+        'string': r'["\'](?:[^"\'\\]|\\.)*["\']',
+        'keyword': r'\b(?:' + '|'.join(KEYWORDS) + r')\b',
+        'type': r'\b(?:' + '|'.join(TYPES) + r')\b',
+        'number': r'\b\d+\.?\d*\b',
+        'function': r'\b\w+(?=\s*\()',
+        'operator': r'[+\-*/%=<>!&|^~]+',
+    }
+    
+    # Single regex matching every token type, one named group per type.
+    # Keywords, types and function names share one identifier branch: the
+    # regex consumes a whole word in one step instead of trying every keyword
+    # alternative at each position, and iter_tokens() classifies the word with
+    # a set lookup. The empty 'call' group is set when '(' follows the word
+    MASTER_PATTERN = re.compile(
+        f"(?P<comment>{TOKEN_PATTERNS['comment']})"
+        f"|(?P<string>{TOKEN_PATTERNS['string']})"
+        f"|(?P<number>{TOKEN_PATTERNS['number']})"
+        r"|(?P<word>\w+)(?P<call>(?=\s*\())?"
+        f"|(?P<operator>{TOKEN_PATTERNS['operator']})",
+        re.MULTILINE | re.DOTALL
+    )
+    
     @staticmethod
     def get_token_patterns():
-        """Get regex patterns for different token types"""
-        return {
-            'keyword': r'\b(' + '|'.join(TSHighlighter.KEYWORDS) + r')\b',
-            'type': r'\b(' + '|'.join(TSHighlighter.TYPES) + r')\b',
-            'string': r'["\'](?:[^"\'\\]|\\.)*["\']',
-            'comment': r'//.*?$|/\*.*?\*/',
-            'number': r'\b\d+\.?\d*\b',
-            'function': r'\b(\w+)(?=\s*\()',
-            'operator': r'[+\-*/%=<>!&|^~]+',
-        }
+        """Get regex patterns for different token types
+        
+        Returns the shared TOKEN_PATTERNS table; do not modify it.
+        """
+        return TSHighlighter.TOKEN_PATTERNS
+    
+    @staticmethod
+    def get_master_pattern():
+        """Get the single compiled regex that matches every token type"""
+        return TSHighlighter.MASTER_PATTERN
+    
+    @staticmethod
+    def iter_tokens(code: str):
+        """Yield (type, start, end) for each highlighted token of T# code
+        
+        Tokens come in source order and never overlap. This is the one place
+        match groups are classified into token types; tokenize() and
+        tokenize_spans() only differ in how they store the result.
+        """
+        keywords = TSHighlighter.KEYWORD_SET
+        types = TSHighlighter.TYPE_SET
+        
+        for match in TSHighlighter.MASTER_PATTERN.finditer(code):
+            token_type = match.lastgroup
+            if token_type in ('word', 'call'):
+                word = match.group(0)
+                if word in keywords:
+                    token_type = 'keyword'
+                elif word in types:
+                    token_type = 'type'
+                elif token_type == 'call':
+                    token_type = 'function'
+                else:
+                    # Plain identifiers are not highlighted
+                    continue
+            start, end = match.span()
+            yield token_type, start, end
     
     @staticmethod
+    @lru_cache(maxsize=16)
     def tokenize(code: str) -> list:
-        """Tokenize T# code"""
-        tokens = []
-        patterns = TSHighlighter.get_token_patterns()
+        """Tokenize T# code
+        
+        Tokens are produced in source order and never overlap. Results are
+        cached per source text, so callers must not modify the returned list.
+        """
+        return [
+            {'type': token_type, 'value': code[start:end], 'start': start, 'end': end}
+            for token_type, start, end in TSHighlighter.iter_tokens(code)
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def tokenize_spans(code: str) -> Tokens:
+        """Tokenize T# code into flat arrays instead of one dict per token
         
-        for token_type, pattern in patterns.items():
-            for match in re.finditer(pattern, code, re.MULTILINE):
-                tokens.append({
-                    'type': token_type,
-                    'value': match.group(0),
-                    'start': match.start(),
-                    'end': match.end()
-                })
+        Token i is code[starts[i]:ends[i]] of type
+        TOKEN_TYPES[type_ids[i]]. Spans are already in source order. Like
+        tokenize(), results are cached and shared between callers.
+        """
+        starts = array('l')
+        ends = array('l')
+        type_ids = array('B')
+        type_index = TSHighlighter.TOKEN_TYPE_IDS
         
-        # Sort by position
-        tokens.sort(key=lambda x: x['start'])
+        for token_type, start, end in TSHighlighter.iter_tokens(code):
+            starts.append(start)
+            ends.append(end)
+            type_ids.append(type_index[token_type])
         
-        return tokens
+        return Tokens(starts, ends, type_ids, code)
     
     @staticmethod
+    @lru_cache(maxsize=16)
     def validate_syntax(code: str) -> tuple:
-        """Basic syntax validation"""
-        errors = []
+        """Basic syntax validation
         
-        # Check for matching braces
-        brace_stack = []
-        for i, char in enumerate(code):
+        Braces and parentheses are checked together in one scan. The regex
+        steps over comments and strings, so the Python loop only runs once
+        per bracket and brackets inside them are ignored. Results are cached
+        per source text.
+        """
+        brace_errors = []
+        paren_errors = []
+        brace_depth = 0
+        paren_depth = 0
+        
+        for match in TSHighlighter.BRACKET_PATTERN.finditer(code):
+            char = match.group(0)
             if char == '{':
-                brace_stack.append((char, i))
+                brace_depth += 1
             elif char == '}':
-                if not brace_stack:
-                    errors.append(f"Unmatched closing brace at position {i}")
+                if brace_depth:
+                    brace_depth -= 1
                 else:
-                    brace_stack.pop()
-        
-        if brace_stack:
-            errors.append(f"Unclosed braces: {len(brace_stack)}")
-        
-        # Check for matching parentheses
-        paren_stack = []
-        for i, char in enumerate(code):
-            if char == '(':
-                paren_stack.append((char, i))
+                    brace_errors.append(f"Unmatched closing brace at position {match.start()}")
+            elif char == '(':
+                paren_depth += 1
             elif char == ')':
-                if not paren_stack:
-                    errors.append(f"Unmatched closing parenthesis at position {i}")
+                if paren_depth:
+                    paren_depth -= 1
                 else:
-                    paren_stack.pop()
+                    paren_errors.append(f"Unmatched closing parenthesis at position {match.start()}")
         
-        if paren_stack:
-            errors.append(f"Unclosed parentheses: {len(paren_stack)}")
+        if brace_depth:
+            brace_errors.append(f"Unclosed braces: {brace_depth}")
+        if paren_depth:
+            paren_errors.append(f"Unclosed parentheses: {paren_depth}")
         
+        errors = brace_errors + paren_errors
         return len(errors) == 0, errors
+    
+    @staticmethod
+    def clear_cache():
+        """Drop cached tokenize/validate_syntax results"""
+        TSHighlighter.tokenize.cache_clear()
+        TSHighlighter.tokenize_spans.cache_clear()
+        TSHighlighter.validate_syntax.cache_clear()
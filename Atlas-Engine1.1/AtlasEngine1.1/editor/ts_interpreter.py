@@ -7,6 +7,7 @@ Completely rewritten for clarity and reliability
 import re
 import math
 import os
+import sys
 from typing import Dict, Any, List
 
 class TSInterpreter:
@@ -18,6 +19,9 @@ class TSInterpreter:
         self.variables = {}
         self.functions = {}
         self.imported_files = set()
+        # Informational command logs, toggled by `verbose on/off`;
+        # errors are logged regardless
+        self.verbose = True
         
         # Get scripts directory
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -60,14 +64,19 @@ class TSInterpreter:
             # Parse into statements
             statements = self.parse_code(code)
             
-            # Execute each statement
+            # Execute each statement; 3D changes made by a statement (and
+            # everything nested in it) are rendered once it finishes
             for stmt in statements:
                 if stmt.strip():
                     self.execute_statement(stmt)
+                    if self.engine3d:
+                        self.engine3d.flush()
             
             self.log("✓ Script completed", "success")
             
         except Exception as e:
+            if self.engine3d:
+                self.engine3d.flush()
             self.log(f"✗ Error: {str(e)}", "error")
     
     def remove_comments(self, code: str) -> str:
@@ -427,6 +436,8 @@ class TSInterpreter:
             self.cmd_info(stmt)
         elif cmd == 'debug':
             self.cmd_debug(stmt)
+        elif cmd == 'verbose':
+            self.cmd_verbose(stmt)
         elif cmd == 'comment' or cmd == 'note':
             pass  # Comments do nothing
         elif cmd == 'assert' or cmd == 'verify':
@@ -488,9 +499,8 @@ class TSInterpreter:
             self.cmd_clear_output(stmt)
         
         # Check for 3D engine commands
-        elif self.engine3d and cmd in self.engine3d.get_command_methods():
-            method = self.engine3d.get_command_methods()[cmd]
-            method(stmt)
+        elif self.engine3d and self.engine3d.has_command(cmd):
+            self.engine3d.dispatch(stmt, cmd)
         
         # ==================== RPG MECHANICS (50 commands) ====================
         # Player Stats
@@ -952,19 +962,19 @@ class TSInterpreter:
             # Try alternate syntax: input variable_name "prompt"
             match = re.match(r'input\s+(\w+)\s+["\'](.+?)["\']', stmt, re.I)
             if match:
-                var_name = match.group(1)
+                var_name = sys.intern(match.group(1))
                 prompt = match.group(2)
             else:
                 # Try simple: input variable_name
                 match = re.match(r'input\s+(\w+)', stmt, re.I)
                 if match:
-                    var_name = match.group(1)
+                    var_name = sys.intern(match.group(1))
                     prompt = "Enter value:"
                 else:
                     return
         else:
             prompt = match.group(1)
-            var_name = match.group(2)
+            var_name = sys.intern(match.group(2))
         
         # Use tkinter simpledialog for input
         try:
@@ -994,7 +1004,7 @@ class TSInterpreter:
     def cmd_cleargraphics(self, stmt: str):
         """cleargraphics - clear graphics canvas"""
         if hasattr(self, 'editor') and self.editor and hasattr(self.editor, 'output_window'):
-            self.editor.output_window.canvas.delete("all")
+            self.editor.output_window.clear_graphics()
             self.output("✓ Graphics cleared", 'show')
     
     # ==================== VARIABLES ====================
@@ -1010,7 +1020,7 @@ class TSInterpreter:
         for pattern in patterns:
             match = re.match(pattern, stmt, re.I)
             if match:
-                name = match.group(1)
+                name = sys.intern(match.group(1))
                 value = self.eval_expr(match.group(2))
                 self.variables[name] = value
                 self.log(f"🧠 {name} = {value}")
@@ -1042,7 +1052,7 @@ class TSInterpreter:
         for pattern in patterns:
             match = re.match(pattern, stmt, re.I)
             if match:
-                name = match.group(1)
+                name = sys.intern(match.group(1))
                 value = self.eval_expr(match.group(2))
                 self.variables[name] = value
                 self.log(f"✨ {name} = {value}")
@@ -1057,7 +1067,7 @@ class TSInterpreter:
         for pattern in patterns:
             match = re.match(pattern, stmt, re.I)
             if match:
-                name = match.group(1)
+                name = sys.intern(match.group(1))
                 value = self.eval_expr(match.group(2))
                 self.variables[name] = value
                 self.log(f"⚙️ {name} = {value}")
@@ -1067,7 +1077,7 @@ class TSInterpreter:
         """create name as value"""
         match = re.match(r'create\s+(\w+)\s+(?:as|with)\s+(.+)', stmt, re.I)
         if match:
-            name = match.group(1)
+            name = sys.intern(match.group(1))
             value = self.eval_expr(match.group(2))
             self.variables[name] = value
             self.log(f"🆕 {name} = {value}")
@@ -1076,7 +1086,7 @@ class TSInterpreter:
         """change name to value"""
         match = re.match(r'change\s+(\w+)\s+to\s+(.+)', stmt, re.I)
         if match:
-            name = match.group(1)
+            name = sys.intern(match.group(1))
             value = self.eval_expr(match.group(2))
             self.variables[name] = value
             self.log(f"🔄 {name} = {value}")
@@ -1111,7 +1121,7 @@ class TSInterpreter:
         for pattern in patterns:
             match = re.match(pattern, stmt, re.I)
             if match:
-                name = match.group(1)
+                name = sys.intern(match.group(1))
                 value = self.eval_expr(match.group(2))
                 self.variables[name] = value
                 self.log(f"✓ {name} = {value}")
@@ -2333,7 +2343,7 @@ class TSInterpreter:
         match = re.match(r'copy\s+(\w+)\s+to\s+(\w+)', stmt, re.I)
         if match:
             from_var = match.group(1)
-            to_var = match.group(2)
+            to_var = sys.intern(match.group(2))
             if from_var in self.variables:
                 self.variables[to_var] = self.variables[from_var]
                 self.log(f"📋 Copied {from_var} to {to_var}")
@@ -2458,7 +2468,7 @@ class TSInterpreter:
         """for loop"""
         match = re.match(r'for\s+(\w+)\s+from\s+(.+?)\s+to\s+(.+?)\s*\{(.+?)\}', stmt, re.I | re.DOTALL)
         if match:
-            var_name = match.group(1)
+            var_name = sys.intern(match.group(1))
             start = int(self.eval_expr(match.group(2)))
             end = int(self.eval_expr(match.group(3)))
             block = match.group(4)
@@ -2474,7 +2484,7 @@ class TSInterpreter:
         """foreach loop"""
         match = re.match(r'foreach\s+(\w+)\s+in\s+(\w+)\s*\{(.+?)\}', stmt, re.I | re.DOTALL)
         if match:
-            var_name = match.group(1)
+            var_name = sys.intern(match.group(1))
             list_name = match.group(2)
             block = match.group(3)
             
@@ -4055,6 +4065,13 @@ class TSInterpreter:
         match = re.match(r'(?:wait|sleep|pause)\s+(?:for\s+)?(.+?)(?:\s+seconds?)?', stmt, re.I)
         if match:
             seconds = self.eval_expr(match.group(1))
+            # Scripts run synchronously, so neither the 3D render after each
+            # top-level statement nor the output window's idle flush can fire
+            # mid-loop; paint the frame drawn so far first
+            if self.engine3d:
+                self.engine3d.flush()
+            if hasattr(self, 'editor') and self.editor and hasattr(self.editor, 'output_window'):
+                self.editor.output_window.flush()
             import time
             time.sleep(float(seconds))
             self.log(f"⏱️ Waited {seconds} seconds")
@@ -4138,6 +4155,13 @@ class TSInterpreter:
             message = self.eval_expr(match.group(1))
             self.log(f"🐛 DEBUG: {message}", "debug")
     
+    def cmd_verbose(self, stmt: str):
+        """verbose on/off - toggle informational command logs"""
+        match = re.match(r'verbose\s+(on|off)\b', stmt, re.I)
+        if match:
+            self.verbose = match.group(1).lower() == 'on'
+            self.log(f"🔊 Verbose {'on' if self.verbose else 'off'}", "info")
+    
     def cmd_assert(self, stmt: str):
         """assert/verify condition"""
         match = re.match(r'(?:assert|verify)\s+(.+)', stmt, re.I)
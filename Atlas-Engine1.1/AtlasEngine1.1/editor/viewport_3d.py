@@ -7,15 +7,26 @@ Custom 3D rendering with shapes, physics, and first-person game mode
 import tkinter as tk
 from tkinter import ttk
 import math
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 
 class Vector3D:
     """3D Vector for viewport"""
+    # Fixed fields: no per-instance __dict__, and faster attribute access
+    __slots__ = ('x', 'y', 'z')
+    
     def __init__(self, x=0.0, y=0.0, z=0.0):
         self.x = float(x)
         self.y = float(y)
         self.z = float(z)
     
+    def set(self, x, y, z):
+        """Overwrite the components in place and return self"""
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        return self
+    
     def __add__(self, other):
         return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
     
@@ -38,8 +49,58 @@ class Vector3D:
         return Vector3D(self.x, self.y, self.z)
 
 
+@lru_cache(maxsize=256)
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """(r, g, b) channels of a "#rrggbb" color, memoized
+    
+    Scenes use a handful of colors, so face shading looks each one up
+    instead of slicing and parsing the string for every face.
+    """
+    hex_color = color.lstrip('#')
+    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+
+
+def chain_edges(edges) -> List[List[int]]:
+    """Chain (a, b) vertex-index edges into paths that share endpoints
+    
+    Every edge appears in exactly one path, so drawing each path as one
+    multi-point canvas line draws exactly the original edges with far fewer
+    canvas items.
+    """
+    incident: Dict[int, List[int]] = {}
+    for k, (a, b) in enumerate(edges):
+        incident.setdefault(a, []).append(k)
+        incident.setdefault(b, []).append(k)
+    
+    used = [False] * len(edges)
+    strips = []
+    for k, (a, b) in enumerate(edges):
+        if used[k]:
+            continue
+        used[k] = True
+        strip = [a, b]
+        tail = b
+        while True:
+            for e in incident[tail]:
+                if not used[e]:
+                    break
+            else:
+                break
+            used[e] = True
+            u, v = edges[e]
+            tail = v if u == tail else u
+            strip.append(tail)
+        strips.append(strip)
+    return strips
+
+
 class Shape3D:
     """Base class for 3D shapes"""
+    # Edge strips per edge list, keyed by id(); the list itself is kept in the
+    # entry so a reused id is never mistaken for a cached one
+    _strip_cache: Dict[int, Tuple[list, List[List[int]]]] = {}
+    STRIP_CACHE_LIMIT = 256
+    
     def __init__(self, position: Vector3D, size: float = 1.0):
         self.position = position
         self.size = size
@@ -70,75 +131,140 @@ class Shape3D:
     def get_faces(self) -> List[List[int]]:
         """Override in subclasses for filled rendering"""
         return []
+    
+    def bounding_radius(self) -> float:
+        """Radius around position that contains every vertex
+        
+        Subclasses with a known shape override this with a closed form.
+        """
+        px, py, pz = self.position.x, self.position.y, self.position.z
+        return max((math.sqrt((v.x - px) ** 2 + (v.y - py) ** 2 + (v.z - pz) ** 2)
+                    for v in self.get_vertices()), default=0.0)
+    
+    def get_edge_strips(self) -> List[List[int]]:
+        """Edges chained into vertex-index paths (see chain_edges)
+        
+        Shapes return shared edge lists, so the chaining is done once per
+        topology and looked up by the list's identity afterwards.
+        """
+        edges = self.get_edges()
+        cached = Shape3D._strip_cache.get(id(edges))
+        if cached is not None and cached[0] is edges:
+            return cached[1]
+        strips = chain_edges(edges)
+        if len(Shape3D._strip_cache) < self.STRIP_CACHE_LIMIT:
+            Shape3D._strip_cache[id(edges)] = (edges, strips)
+        return strips
+    
+    def rotation_matrix(self) -> Tuple[Tuple[float, float, float], ...]:
+        """Rotation as a 3x3 matrix (rows), for rotating many vertices
+        
+        Equivalent to rotating around X, then Y, then Z by the Euler angles,
+        but the six sin/cos values are computed once per shape instead of
+        once per vertex.
+        """
+        return self.euler_matrix(self.rotation.x, self.rotation.y, self.rotation.z)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def euler_matrix(angle_x: float, angle_y: float, angle_z: float,
+                     scale_x: float = 1.0, scale_y: float = 1.0,
+                     scale_z: float = 1.0) -> Tuple[Tuple[float, float, float], ...]:
+        """Rotation matrix for Euler angles in degrees, memoized
+        
+        Most shapes keep their rotation between frames (and many share
+        0, 0, 0), so the trig is only done when an angle actually changes.
+        An optional per-axis scale is folded into the matrix columns.
+        """
+        rx = math.radians(angle_x)
+        ry = math.radians(angle_y)
+        rz = math.radians(angle_z)
+        sx, cx = math.sin(rx), math.cos(rx)
+        sy, cy = math.sin(ry), math.cos(ry)
+        sz, cz = math.sin(rz), math.cos(rz)
+        
+        return (
+            (cz * cy * scale_x, (cz * sy * sx - sz * cx) * scale_y, (cz * sy * cx + sz * sx) * scale_z),
+            (sz * cy * scale_x, (sz * sy * sx + cz * cx) * scale_y, (sz * sy * cx - cz * sx) * scale_z),
+            (-sy * scale_x, cy * sx * scale_y, cy * cx * scale_z),
+        )
+    
+    def rotate_vertex(self, v: Vector3D) -> Vector3D:
+        """Rotate vertex by rotation angles"""
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = self.rotation_matrix()
+        return Vector3D(m00 * v.x + m01 * v.y + m02 * v.z,
+                        m10 * v.x + m11 * v.y + m12 * v.z,
+                        m20 * v.x + m21 * v.y + m22 * v.z)
+    
+    def transform_points(self, points, scale=None) -> List[Vector3D]:
+        """Scale, rotate and move local (x, y, z) points to world space
+        
+        An optional (sx, sy, sz) scale is folded into the rotation matrix
+        columns, so each point takes a single multiply-add pass.
+        """
+        rotation = self.rotation
+        if scale is None:
+            matrix = self.euler_matrix(rotation.x, rotation.y, rotation.z)
+        else:
+            matrix = self.euler_matrix(rotation.x, rotation.y, rotation.z, *scale)
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = matrix
+        px, py, pz = self.position.x, self.position.y, self.position.z
+        return [Vector3D(m00 * x + m01 * y + m02 * z + px,
+                         m10 * x + m11 * y + m12 * z + py,
+                         m20 * x + m21 * y + m22 * z + pz)
+                for x, y, z in points]
 
 
 class Cube(Shape3D):
     """Cube shape"""
+    # Topology never changes, so edge and face index tuples are shared
+    EDGES = (
+        (0,1), (1,2), (2,3), (3,0),  # Back face
+        (4,5), (5,6), (6,7), (7,4),  # Front face
+        (0,4), (1,5), (2,6), (3,7)   # Connecting edges
+    )
+    FACES = (
+        (0, 1, 2, 3),  # Back face
+        (4, 5, 6, 7),  # Front face
+        (0, 1, 5, 4),  # Bottom face
+        (2, 3, 7, 6),  # Top face
+        (0, 3, 7, 4),  # Left face
+        (1, 2, 6, 5),  # Right face
+    )
+    # Corners of a cube with half-extent 1, scaled per shape
+    CORNERS = (
+        (-1.0, -1.0, -1.0), (1.0, -1.0, -1.0),
+        (1.0, 1.0, -1.0), (-1.0, 1.0, -1.0),
+        (-1.0, -1.0, 1.0), (1.0, -1.0, 1.0),
+        (1.0, 1.0, 1.0), (-1.0, 1.0, 1.0)
+    )
+    
     def get_vertices(self):
         # Apply non-uniform scale to base size
         sx = self.size * self.scale.x / 2
         sy = self.size * self.scale.y / 2
         sz = self.size * self.scale.z / 2
         
-        vertices = [
-            Vector3D(-sx, -sy, -sz), Vector3D(sx, -sy, -sz),
-            Vector3D(sx, sy, -sz), Vector3D(-sx, sy, -sz),
-            Vector3D(-sx, -sy, sz), Vector3D(sx, -sy, sz),
-            Vector3D(sx, sy, sz), Vector3D(-sx, sy, sz)
-        ]
-        
-        # Apply rotation
-        rotated = []
-        for v in vertices:
-            rotated.append(self.rotate_vertex(v))
-        
-        # Apply position
-        return [Vector3D(v.x + self.position.x, 
-                        v.y + self.position.y, 
-                        v.z + self.position.z) for v in rotated]
+        # Apply scale, rotation and position in one pass
+        return self.transform_points(self.CORNERS, (sx, sy, sz))
     
     def get_edges(self):
-        return [
-            (0,1), (1,2), (2,3), (3,0),  # Back face
-            (4,5), (5,6), (6,7), (7,4),  # Front face
-            (0,4), (1,5), (2,6), (3,7)   # Connecting edges
-        ]
+        return self.EDGES
     
     def get_faces(self):
         """Return faces for filled rendering (list of vertex indices for each face)"""
-        return [
-            [0, 1, 2, 3],  # Back face
-            [4, 5, 6, 7],  # Front face
-            [0, 1, 5, 4],  # Bottom face
-            [2, 3, 7, 6],  # Top face
-            [0, 3, 7, 4],  # Left face
-            [1, 2, 6, 5],  # Right face
-        ]
+        return self.FACES
     
-    def rotate_vertex(self, v: Vector3D) -> Vector3D:
-        """Rotate vertex by rotation angles"""
-        # Rotate around X
-        rx = math.radians(self.rotation.x)
-        y = v.y * math.cos(rx) - v.z * math.sin(rx)
-        z = v.y * math.sin(rx) + v.z * math.cos(rx)
-        v = Vector3D(v.x, y, z)
-        
-        # Rotate around Y
-        ry = math.radians(self.rotation.y)
-        x = v.x * math.cos(ry) + v.z * math.sin(ry)
-        z = -v.x * math.sin(ry) + v.z * math.cos(ry)
-        v = Vector3D(x, v.y, z)
-        
-        # Rotate around Z
-        rz = math.radians(self.rotation.z)
-        x = v.x * math.cos(rz) - v.y * math.sin(rz)
-        y = v.x * math.sin(rz) + v.y * math.cos(rz)
-        
-        return Vector3D(x, y, v.z)
+    def bounding_radius(self):
+        # Half the scaled box diagonal; rotation does not change it
+        return self.size / 2 * math.sqrt(self.scale.x ** 2 + self.scale.y ** 2 + self.scale.z ** 2)
 
 
 class Plane(Shape3D):
     """Plane/ground shape"""
+    EDGES = ((0,1), (1,2), (2,3), (3,0),
+             (0,2), (1,3))  # Diagonals for grid
+    
     def __init__(self, position: Vector3D, size: float = 10.0):
         super().__init__(position, size)
         self.color = "#666666"
@@ -154,55 +280,76 @@ class Plane(Shape3D):
         ]
     
     def get_edges(self):
-        return [(0,1), (1,2), (2,3), (3,0),
-                (0,2), (1,3)]  # Diagonals for grid
+        return self.EDGES
+    
+    def bounding_radius(self):
+        return self.size * math.sqrt(2)
 
 
 class Sphere(Shape3D):
     """Sphere shape (approximated with vertices)"""
+    # Unit-radius local vertices and edge lists, built once per segment count
+    _template_cache: Dict[int, List[Tuple[float, float, float]]] = {}
+    _edge_cache: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+    
     def __init__(self, position: Vector3D, size: float = 1.0):
         super().__init__(position, size)
         self.segments = 12
         self.is_rolling = True  # Spheres can roll
         self.color = "#ff8800"
     
+    @classmethod
+    def _get_template(cls, segments: int) -> List[Tuple[float, float, float]]:
+        """Unit-radius sphere vertices around the origin"""
+        template = cls._template_cache.get(segments)
+        if template is None:
+            # Every ring shares the same phi values and every column the same
+            # theta, so take sin/cos once per angle instead of per vertex
+            phis = [(j / segments) * math.pi for j in range(segments)]
+            ring = [(math.sin(phi), math.cos(phi)) for phi in phis]
+            template = []
+            for i in range(segments):
+                theta = (i / segments) * 2 * math.pi
+                cos_t = math.cos(theta)
+                sin_t = math.sin(theta)
+                for r, y in ring:
+                    template.append((r * cos_t, y, r * sin_t))
+            cls._template_cache[segments] = template
+        return template
+    
     def get_vertices(self):
-        vertices = []
         radius = self.size / 2
-        
-        for i in range(self.segments):
-            theta = (i / self.segments) * 2 * math.pi
-            for j in range(self.segments):
-                phi = (j / self.segments) * math.pi
-                
-                x = radius * math.sin(phi) * math.cos(theta)
-                y = radius * math.cos(phi)
-                z = radius * math.sin(phi) * math.sin(theta)
-                
-                vertices.append(Vector3D(
-                    x + self.position.x,
-                    y + self.position.y,
-                    z + self.position.z
-                ))
-        
-        return vertices
+        px, py, pz = self.position.x, self.position.y, self.position.z
+        return [Vector3D(x * radius + px, y * radius + py, z * radius + pz)
+                for x, y, z in self._get_template(self.segments)]
+    
+    def bounding_radius(self):
+        return self.size / 2
     
     def get_edges(self):
-        edges = []
-        for i in range(self.segments - 1):
-            for j in range(self.segments):
-                current = i * self.segments + j
-                next_ring = (i + 1) * self.segments + j
-                next_segment = i * self.segments + ((j + 1) % self.segments)
-                
-                edges.append((current, next_ring))
-                edges.append((current, next_segment))
+        edges = self._edge_cache.get(self.segments)
+        if edges is None:
+            edges = []
+            for i in range(self.segments - 1):
+                for j in range(self.segments):
+                    current = i * self.segments + j
+                    next_ring = (i + 1) * self.segments + j
+                    next_segment = i * self.segments + ((j + 1) % self.segments)
+                    
+                    edges.append((current, next_ring))
+                    edges.append((current, next_segment))
+            edges = tuple(edges)
+            self._edge_cache[self.segments] = edges
         
         return edges
 
 
 class Cone(Shape3D):
     """Cone shape (pyramid with circular base)"""
+    # Unit base circle (cos, sin) and edge lists, built once per segment count
+    _template_cache: Dict[int, List[Tuple[float, float]]] = {}
+    _edge_cache: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+    
     def __init__(self, position: Vector3D, size: float = 1.0):
         super().__init__(position, size)
         self.segments = 16  # Number of segments around base
@@ -230,20 +377,33 @@ class Cone(Shape3D):
         vertices.append(base_center)
         
         # Base circle vertices
-        for i in range(self.segments):
-            theta = (i / self.segments) * 2 * math.pi
-            x = radius * math.cos(theta)
-            z = radius * math.sin(theta)
-            
+        base_y = self.position.y - height / 2
+        for cos_t, sin_t in self._get_template(self.segments):
             vertices.append(Vector3D(
-                self.position.x + x,
-                self.position.y - height / 2,
-                self.position.z + z
+                self.position.x + radius * cos_t,
+                base_y,
+                self.position.z + radius * sin_t
             ))
         
         return vertices
     
+    @classmethod
+    def _get_template(cls, segments: int) -> List[Tuple[float, float]]:
+        """Unit base circle as (cos, sin) pairs"""
+        template = cls._template_cache.get(segments)
+        if template is None:
+            template = []
+            for i in range(segments):
+                theta = (i / segments) * 2 * math.pi
+                template.append((math.cos(theta), math.sin(theta)))
+            cls._template_cache[segments] = template
+        return template
+    
     def get_edges(self):
+        edges = self._edge_cache.get(self.segments)
+        if edges is not None:
+            return edges
+        
         edges = []
         
         # Edges from apex to base circle
@@ -260,11 +420,45 @@ class Cone(Shape3D):
         for i in range(self.segments):
             edges.append((1, i + 2))  # Base center to base circle vertex
         
+        edges = tuple(edges)
+        self._edge_cache[self.segments] = edges
         return edges
+    
+    def bounding_radius(self):
+        # Base rim: radius size/2, size/2 below the center
+        return self.size / 2 * math.sqrt(2)
 
 
 class Wedge(Shape3D):
     """Wedge/Ramp shape - triangular prism for stairs/slopes"""
+    EDGES = (
+        # Bottom face
+        (0, 1), (1, 2), (2, 3), (3, 0),
+        
+        # Top edge
+        (4, 5),
+        
+        # Vertical edges
+        (0, 4), (1, 5),
+        
+        # Sloped faces
+        (2, 4), (2, 5), (3, 4), (3, 5)
+    )
+    # Wedge vertices (like a ramp) with half-extent 1, scaled per shape
+    # Bottom face: 4 vertices (rectangular base)
+    # Top edge: 2 vertices (the top edge of the ramp)
+    CORNERS = (
+        # Bottom face (4 vertices)
+        (-1.0, -1.0, -1.0),  # 0: bottom back left
+        (1.0, -1.0, -1.0),   # 1: bottom back right
+        (1.0, -1.0, 1.0),    # 2: bottom front right
+        (-1.0, -1.0, 1.0),   # 3: bottom front left
+        
+        # Top edge (2 vertices - the high end of the ramp)
+        (-1.0, 1.0, -1.0),   # 4: top back left
+        (1.0, 1.0, -1.0),    # 5: top back right
+    )
+    
     def __init__(self, position: Vector3D, size: float = 1.0):
         super().__init__(position, size)
         self.color = "#a0826d"  # Light brown
@@ -275,66 +469,23 @@ class Wedge(Shape3D):
         sy = self.size * self.scale.y / 2
         sz = self.size * self.scale.z / 2
         
-        # Wedge vertices (like a ramp)
-        # Bottom face: 4 vertices (rectangular base)
-        # Top edge: 2 vertices (the top edge of the ramp)
-        vertices = [
-            # Bottom face (4 vertices)
-            Vector3D(-sx, -sy, -sz),  # 0: bottom back left
-            Vector3D(sx, -sy, -sz),   # 1: bottom back right
-            Vector3D(sx, -sy, sz),    # 2: bottom front right
-            Vector3D(-sx, -sy, sz),   # 3: bottom front left
-            
-            # Top edge (2 vertices - the high end of the ramp)
-            Vector3D(-sx, sy, -sz),   # 4: top back left
-            Vector3D(sx, sy, -sz),    # 5: top back right
-        ]
-        
-        # Apply rotation
-        rotated = []
-        for v in vertices:
-            rotated.append(self.rotate_vertex(v))
-        
-        # Apply position
-        return [Vector3D(v.x + self.position.x, 
-                        v.y + self.position.y, 
-                        v.z + self.position.z) for v in rotated]
+        # Apply scale, rotation and position in one pass
+        return self.transform_points(self.CORNERS, (sx, sy, sz))
     
     def get_edges(self):
-        return [
-            # Bottom face
-            (0, 1), (1, 2), (2, 3), (3, 0),
-            
-            # Top edge
-            (4, 5),
-            
-            # Vertical edges
-            (0, 4), (1, 5),
-            
-            # Sloped faces
-            (2, 4), (2, 5), (3, 4), (3, 5)
-        ]
+        return self.EDGES
     
-    def rotate_vertex(self, v: Vector3D) -> Vector3D:
-        """Rotate vertex by rotation angles"""
-        # Rotate around X
-        rx = math.radians(self.rotation.x)
-        y = v.y * math.cos(rx) - v.z * math.sin(rx)
-        z = v.y * math.sin(rx) + v.z * math.cos(rx)
-        v = Vector3D(v.x, y, z)
-        
-        # Rotate around Y
-        ry = math.radians(self.rotation.y)
-        x = v.x * math.cos(ry) + v.z * math.sin(ry)
-        z = -v.x * math.sin(ry) + v.z * math.cos(ry)
-        v = Vector3D(x, v.y, z)
-        
-        # Rotate around Z
-        rz = math.radians(self.rotation.z)
-        x = v.x * math.cos(rz) - v.y * math.sin(rz)
-        y = v.x * math.sin(rz) + v.y * math.cos(rz)
-        
-        return Vector3D(x, y, v.z)
+    def bounding_radius(self):
+        # Half the scaled box diagonal; rotation does not change it
+        return self.size / 2 * math.sqrt(self.scale.x ** 2 + self.scale.y ** 2 + self.scale.z ** 2)
+
+
+# Color a shape returns to when its collision highlight is removed
+DEFAULT_COLORS = {
+    Sphere: "#ff8800",
+    Cube: "#00ff00",
+    Cone: "#ff00ff",
+}
 
 
 class Camera:
@@ -352,12 +503,71 @@ class Camera:
         self.pitch = 0.0
 
 
+class ShapeList:
+    """Scene shapes in insertion order with O(1) membership and removal
+    
+    Backed by a dict keyed on id(shape). Dicts keep insertion order, so
+    shapes are iterated in the order they were added, exactly as with a
+    list, but deleting one does not scan the whole scene. Only iteration
+    order is preserved here: drawing goes through depth_sorted(), which
+    reorders shapes back to front and falls back to this order on ties.
+    """
+    def __init__(self):
+        self._items: Dict[int, Shape3D] = {}
+    
+    def append(self, shape: Shape3D):
+        self._items[id(shape)] = shape
+    
+    def remove(self, shape: Shape3D):
+        """Remove a shape, raising ValueError if it is not in the scene"""
+        if not self.discard(shape):
+            raise ValueError("shape not in scene")
+    
+    def discard(self, shape: Shape3D) -> bool:
+        """Remove a shape if present; return whether it was removed"""
+        return self._items.pop(id(shape), None) is not None
+    
+    def clear(self):
+        self._items.clear()
+    
+    def __contains__(self, shape) -> bool:
+        return self._items.get(id(shape)) is shape
+    
+    def __iter__(self):
+        return iter(self._items.values())
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class Viewport3D:
     """3D Viewport with rendering and game engine"""
     
     MODE_TRAJECTORY = "trajectory"
     MODE_GAME = "game"
     
+    # Gizmo arrows: axis name (tag suffix), unit world offset, color
+    GIZMO_AXES = (
+        ("x", (1, 0, 0), "#ff0000"),
+        ("y", (0, 1, 0), "#00ff00"),
+        ("z", (0, 0, 1), "#0088ff"),
+    )
+    # Arrow-head barbs point back along the shaft, turned by +/-0.5 rad
+    GIZMO_BARB_COS = math.cos(0.5)
+    GIZMO_BARB_SIN = math.sin(0.5)
+    
+    # Held-key camera controls, applied every tick by update_camera_movement:
+    # movement as (x, y, z) steps of camera_speed, rotation as (x, y) degrees
+    CAMERA_MOVE_KEYS = {
+        'w': (0, 0, 1), 's': (0, 0, -1),
+        'a': (-1, 0, 0), 'd': (1, 0, 0),
+        'q': (0, -1, 0), 'e': (0, 1, 0),  # Q/E for vertical movement
+    }
+    CAMERA_TURN_KEYS = {
+        'left': (0.0, -2.0), 'right': (0.0, 2.0),
+        'up': (-2.0, 0.0), 'down': (2.0, 0.0),
+    }
+    
     # 8 Gameplay Modes
     GAMEPLAY_MODE_SHOOTER = "🔫 Shooter"
     GAMEPLAY_MODE_EXPLORER = "🗺️ Explorer"
@@ -373,7 +583,7 @@ class Viewport3D:
         self.frame = tk.Frame(parent, bg="#1e1e1e")
         
         # Scene data
-        self.shapes: List[Shape3D] = []
+        self.shapes = ShapeList()
         self.camera = Camera()
         self.selected_shape: Optional[Shape3D] = None
         
@@ -416,6 +626,31 @@ class Viewport3D:
         # Animation
         self.animation_running = False
         
+        # Projections reused across frames while their inputs are unchanged:
+        # id(shape) -> (key, vertices, projected). Keys hold the camera state
+        # and every input to get_vertices()
+        self._projection_cache = {}
+        # Persistent grid line items, whether each is hidden, and the camera
+        # key their coordinates were last set for (see draw_grid)
+        self._grid_items = []
+        self._grid_hidden = []
+        self._grid_key = None
+        # id(shape) -> (projected, color, light_level, polygons), see shade_faces
+        self._face_cache = {}
+        # id(shape) -> (projected, polylines), see edge_polylines
+        self._edge_cache = {}
+        # Canvas items of the axes, shapes and badges in stacking order, as
+        # (kind, item, coords, options), and the next slot to fill this frame
+        # (see draw_item)
+        self._scene_items = []
+        self._scene_cursor = 0
+        # Overlay text items by hud_text() key, as [item, coords, text, shown],
+        # and the keys drawn this frame
+        self._hud_items = {}
+        self._hud_drawn = set()
+        # A redraw is queued for the next idle (see schedule_render)
+        self._render_pending = False
+        
         # UI (after all attributes are initialized)
         self.setup_ui()
         
@@ -480,9 +715,10 @@ class Viewport3D:
                                       bg="#666666", fg="white", relief=tk.FLAT, padx=6)
         self.pro_mode_btn.pack(side=tk.LEFT, padx=2)
         
-        # Gizmo mode buttons
+        # Gizmo mode buttons (label is hidden, not destroyed, in professional mode)
+        self.gizmo_label = tk.Label(toolbar, text="Gizmo:", bg="#252526", fg="#cccccc")
         if not self.professional_mode:
-            tk.Label(toolbar, text="Gizmo:", bg="#252526", fg="#cccccc").pack(side=tk.LEFT, padx=(20,5))
+            self.gizmo_label.pack(side=tk.LEFT, padx=(20,5))
         
         move_text = "↔️" if self.professional_mode else "Move"
         self.gizmo_translate_btn = tk.Button(toolbar, text=move_text, command=lambda: self.set_gizmo_mode('translate'),
@@ -506,8 +742,9 @@ class Viewport3D:
         self.fill_btn.pack(side=tk.LEFT, padx=2)
         
         # Collision toggle button
+        self.physics_label = tk.Label(toolbar, text="Physics:", bg="#252526", fg="#cccccc")
         if not self.professional_mode:
-            tk.Label(toolbar, text="Physics:", bg="#252526", fg="#cccccc").pack(side=tk.LEFT, padx=(20,5))
+            self.physics_label.pack(side=tk.LEFT, padx=(20,5))
         
         collision_text = "🛡️" if self.professional_mode else "🛡️ Collision"
         self.collision_btn = tk.Button(toolbar, text=collision_text, command=self.toggle_collision,
@@ -516,8 +753,9 @@ class Viewport3D:
         
         # Clear button
         clear_text = "🗑️" if self.professional_mode else "Clear"
-        tk.Button(toolbar, text=clear_text, command=self.clear_scene,
-                 bg="#c24545", fg="white", relief=tk.FLAT, padx=10).pack(side=tk.RIGHT, padx=2)
+        self.clear_btn = tk.Button(toolbar, text=clear_text, command=self.clear_scene,
+                                   bg="#c24545", fg="white", relief=tk.FLAT, padx=10)
+        self.clear_btn.pack(side=tk.RIGHT, padx=2)
         
         # Canvas for 3D rendering (left side)
         main_container = tk.Frame(self.frame, bg="#2b2b2b")
@@ -689,7 +927,7 @@ class Viewport3D:
             self.canvas.config(cursor="")
             self.player_controls_enabled = False
         
-        self.render()
+        self.schedule_render()
     
     def set_gizmo_mode(self, mode):
         """Set the gizmo transformation mode"""
@@ -710,7 +948,7 @@ class Viewport3D:
             self.gizmo_scale_btn.config(bg="#0e639c")
             self.editor.log("Gizmo mode: SCALE (drag XYZ arrows)", "info")
         
-        self.render()
+        self.schedule_render()
     
     def toggle_collision(self):
         """Toggle collision for selected object"""
@@ -730,15 +968,10 @@ class Viewport3D:
             self.collision_btn.config(bg="#3c3c3c")
             self.editor.log(f"Collision DISABLED for {type(self.selected_shape).__name__}", "info")
             # Restore original color
-            if isinstance(self.selected_shape, Sphere):
-                self.selected_shape.color = "#ff8800"
-            elif isinstance(self.selected_shape, Cube):
-                self.selected_shape.color = "#00ff00"
-            elif isinstance(self.selected_shape, Cone):
-                self.selected_shape.color = "#ff00ff"
+            self._restore_default_color(self.selected_shape)
         
         self.collision_var.set(self.selected_shape.has_collision)
-        self.render()
+        self.schedule_render()
     
     def update_collision(self):
         """Update collision from checkbox"""
@@ -750,13 +983,13 @@ class Viewport3D:
                     self.selected_shape.color = "#00ffff"
             else:
                 self.collision_btn.config(bg="#3c3c3c")
-                if isinstance(self.selected_shape, Sphere):
-                    self.selected_shape.color = "#ff8800"
-                elif isinstance(self.selected_shape, Cube):
-                    self.selected_shape.color = "#00ff00"
-                elif isinstance(self.selected_shape, Cone):
-                    self.selected_shape.color = "#ff00ff"
-            self.render()
+                self._restore_default_color(self.selected_shape)
+            self.schedule_render()
+    
+    @staticmethod
+    def _restore_default_color(shape):
+        """Reset a shape to its type's default color, if it has one"""
+        shape.color = DEFAULT_COLORS.get(type(shape), shape.color)
     
     def toggle_fill(self):
         """Toggle filled rendering for selected object"""
@@ -773,7 +1006,7 @@ class Viewport3D:
             self.fill_btn.config(bg="#3c3c3c")
             self.editor.log(f"Wireframe rendering for {type(self.selected_shape).__name__}", "info")
         
-        self.render()
+        self.schedule_render()
     
     def toggle_professional_mode(self):
         """Toggle professional mode (compact UI)"""
@@ -784,87 +1017,34 @@ class Viewport3D:
         else:
             self.editor.log("Regular UI mode enabled", "info")
         
-        # Rebuild toolbar buttons with new mode
-        self.rebuild_toolbar_buttons()
-    
-    def rebuild_toolbar_buttons(self):
-        """Rebuild toolbar buttons dynamically based on professional mode"""
-        # Find and destroy old buttons (everything after mode selector)
-        for widget in self.toolbar.winfo_children():
-            # Keep the mode selector and Add buttons, rebuild everything after
-            if isinstance(widget, tk.Button) and hasattr(widget, 'config'):
-                widget_text = widget.cget('text')
-                # Rebuild gizmo and utility buttons
-                if any(x in str(widget_text) for x in ['Mode', 'Pro', 'Move', '↔️', 'Rotate', '🔄', 
-                                                         'Scale', '📏', 'Fill', '🪣', 'Collision', '🛡️', 
-                                                         'Clear', '🗑️']):
-                    widget.destroy()
-            elif isinstance(widget, tk.Label):
-                label_text = widget.cget('text')
-                if 'Gizmo:' in label_text or 'Physics:' in label_text:
-                    widget.destroy()
-        
-        # Rebuild buttons with current mode
-        toolbar = self.toolbar
-        
-        # Mode button
-        mode_text = "⚙️" if self.professional_mode else "⚙️ Mode"
-        self.mode_sidebar_btn = tk.Button(toolbar, text=mode_text, command=self.toggle_mode_sidebar,
-                                         bg="#0e639c", fg="white", relief=tk.FLAT, padx=10)
-        self.mode_sidebar_btn.pack(side=tk.LEFT, padx=2)
-        
-        # Pro button
-        pro_text = "💼" if self.professional_mode else "💼 Pro"
-        pro_bg = "#4caf50" if self.professional_mode else "#666666"
-        self.pro_mode_btn = tk.Button(toolbar, text=pro_text, command=self.toggle_professional_mode,
-                                      bg=pro_bg, fg="white", relief=tk.FLAT, padx=6)
-        self.pro_mode_btn.pack(side=tk.LEFT, padx=2)
-        
-        # Gizmo label
-        if not self.professional_mode:
-            tk.Label(toolbar, text="Gizmo:", bg="#252526", fg="#cccccc").pack(side=tk.LEFT, padx=(20,5))
-        
-        # Gizmo buttons
-        move_text = "↔️" if self.professional_mode else "Move"
-        move_bg = "#0e639c" if self.gizmo_mode == 'translate' else "#3c3c3c"
-        self.gizmo_translate_btn = tk.Button(toolbar, text=move_text, command=lambda: self.set_gizmo_mode('translate'),
-                                            bg=move_bg, fg="white", relief=tk.FLAT, padx=8)
-        self.gizmo_translate_btn.pack(side=tk.LEFT, padx=2)
-        
-        rotate_text = "🔄" if self.professional_mode else "Rotate"
-        rotate_bg = "#0e639c" if self.gizmo_mode == 'rotate' else "#3c3c3c"
-        self.gizmo_rotate_btn = tk.Button(toolbar, text=rotate_text, command=lambda: self.set_gizmo_mode('rotate'),
-                                         bg=rotate_bg, fg="white", relief=tk.FLAT, padx=8)
-        self.gizmo_rotate_btn.pack(side=tk.LEFT, padx=2)
-        
-        scale_text = "📏" if self.professional_mode else "Scale"
-        scale_bg = "#0e639c" if self.gizmo_mode == 'scale' else "#3c3c3c"
-        self.gizmo_scale_btn = tk.Button(toolbar, text=scale_text, command=lambda: self.set_gizmo_mode('scale'),
-                                        bg=scale_bg, fg="white", relief=tk.FLAT, padx=8)
-        self.gizmo_scale_btn.pack(side=tk.LEFT, padx=2)
-        
-        # Fill button
-        fill_text = "🪣" if self.professional_mode else "🪣 Fill"
-        fill_bg = "#4caf50" if self.selected_shape and self.selected_shape.filled else "#3c3c3c"
-        self.fill_btn = tk.Button(toolbar, text=fill_text, command=self.toggle_fill,
-                                 bg=fill_bg, fg="white", relief=tk.FLAT, padx=8)
-        self.fill_btn.pack(side=tk.LEFT, padx=2)
-        
-        # Physics label
-        if not self.professional_mode:
-            tk.Label(toolbar, text="Physics:", bg="#252526", fg="#cccccc").pack(side=tk.LEFT, padx=(20,5))
-        
-        # Collision button
-        collision_text = "🛡️" if self.professional_mode else "🛡️ Collision"
-        collision_bg = "#4caf50" if self.selected_shape and self.selected_shape.has_collision else "#3c3c3c"
-        self.collision_btn = tk.Button(toolbar, text=collision_text, command=self.toggle_collision,
-                                      bg=collision_bg, fg="white", relief=tk.FLAT, padx=8)
-        self.collision_btn.pack(side=tk.LEFT, padx=2)
-        
-        # Clear button
-        clear_text = "🗑️" if self.professional_mode else "Clear"
-        tk.Button(toolbar, text=clear_text, command=self.clear_scene,
-                 bg="#c24545", fg="white", relief=tk.FLAT, padx=10).pack(side=tk.RIGHT, padx=2)
+        # Relabel the existing toolbar buttons with the new mode
+        self._apply_mode_to_buttons()
+    
+    def _apply_mode_to_buttons(self):
+        """Update toolbar button labels in place for the current UI mode
+        
+        Only text, colour and the two section labels change between modes,
+        so the buttons are reconfigured rather than destroyed and recreated.
+        """
+        pro = self.professional_mode
+        
+        self.mode_sidebar_btn.config(text="⚙️" if pro else "⚙️ Mode")
+        self.pro_mode_btn.config(text="💼" if pro else "💼 Pro",
+                                 bg="#4caf50" if pro else "#666666")
+        self.gizmo_translate_btn.config(text="↔️" if pro else "Move")
+        self.gizmo_rotate_btn.config(text="🔄" if pro else "Rotate")
+        self.gizmo_scale_btn.config(text="📏" if pro else "Scale")
+        self.fill_btn.config(text="🪣" if pro else "🪣 Fill")
+        self.collision_btn.config(text="🛡️" if pro else "🛡️ Collision")
+        self.clear_btn.config(text="🗑️" if pro else "Clear")
+        
+        # Section labels keep their slot in front of the buttons they head
+        if pro:
+            self.gizmo_label.pack_forget()
+            self.physics_label.pack_forget()
+        else:
+            self.gizmo_label.pack(side=tk.LEFT, padx=(20,5), before=self.gizmo_translate_btn)
+            self.physics_label.pack(side=tk.LEFT, padx=(20,5), before=self.collision_btn)
     
     def add_cube(self):
         """Add a cube to the scene"""
@@ -874,7 +1054,7 @@ class Viewport3D:
         self.selected_shape = cube
         self.update_property_panel()
         self.editor.log(f"Added cube at (0, 2, 0)")
-        self.render()
+        self.schedule_render()
     
     def add_sphere(self):
         """Add a sphere to the scene"""
@@ -884,7 +1064,7 @@ class Viewport3D:
         self.selected_shape = sphere
         self.update_property_panel()
         self.editor.log(f"Added sphere at (2, 3, 0)")
-        self.render()
+        self.schedule_render()
     
     def add_cone(self):
         """Add a cone to the scene"""
@@ -894,7 +1074,7 @@ class Viewport3D:
         self.selected_shape = cone
         self.update_property_panel()
         self.editor.log(f"Added cone at (-2, 2, 0)")
-        self.render()
+        self.schedule_render()
     
     def add_plane(self):
         """Add a plane to the scene"""
@@ -903,7 +1083,7 @@ class Viewport3D:
         self.selected_shape = plane
         self.update_property_panel()
         self.editor.log(f"Added plane at (0, 0, 0)")
-        self.render()
+        self.schedule_render()
     
     def add_player(self):
         """Add player character"""
@@ -954,7 +1134,7 @@ class Viewport3D:
         self.editor.log("Press '🚪 Exit Game' button to leave player mode", "info")
         
         self.canvas.focus_set()
-        self.render()
+        self.schedule_render()
     
     def toggle_player_viewport_mode(self):
         """Toggle between Player mode and Viewport mode"""
@@ -997,7 +1177,7 @@ class Viewport3D:
             self.editor.log("🎮 Player Mode: First-person control active", "success")
             self.editor.log("Click '🚪 Exit Game' to leave and view from outside")
         
-        self.render()
+        self.schedule_render()
     
     def show_build_menu(self):
         """Show quick build menu in Builder mode"""
@@ -1044,19 +1224,22 @@ class Viewport3D:
         y = round(y / grid_size) * grid_size
         z = round(z / grid_size) * grid_size
         
-        # Check if there's already a block at this position
+        # Check if there's already a block at this position. Only walls stack,
+        # so other placements skip the scan of the scene
         existing_block = None
-        for shape in self.shapes:
-            if isinstance(shape, Cube):
-                # Check if positions are very close (within snapping tolerance)
-                if (abs(shape.position.x - x) < 0.5 and 
-                    abs(shape.position.y - y) < 0.5 and 
-                    abs(shape.position.z - z) < 0.5):
-                    existing_block = shape
-                    break
+        if key == '4':
+            for shape in self.shapes:
+                if isinstance(shape, Cube):
+                    # Check if positions are very close (within snapping tolerance)
+                    position = shape.position
+                    if (abs(position.x - x) < 0.5 and 
+                        abs(position.y - y) < 0.5 and 
+                        abs(position.z - z) < 0.5):
+                        existing_block = shape
+                        break
         
         # If placing a wall and there's already a block, stack on top of it!
-        if existing_block and key == '4':
+        if existing_block:
             y = existing_block.position.y + existing_block.size * existing_block.scale.y
             self.editor.log("🧱 Stacking wall on top!", "info")
         
@@ -1125,7 +1308,7 @@ class Viewport3D:
             self.shapes.append(light)
             self.editor.log(f"💡 Placed Light Block at Y={y:.1f}", "success")
         
-        self.render()
+        self.schedule_render()
     
     def toggle_physics(self):
         """Toggle physics simulation"""
@@ -1155,32 +1338,46 @@ class Viewport3D:
         self.camera.is_first_person = False
         self.update_property_panel()
         self.editor.log("Scene cleared")
-        self.render()
+        self.schedule_render()
     
     def update_property_panel(self):
         """Update property panel with selected shape data"""
         if self.selected_shape:
-            self.pos_x_var.set(f"{self.selected_shape.position.x:.2f}")
-            self.pos_y_var.set(f"{self.selected_shape.position.y:.2f}")
-            self.pos_z_var.set(f"{self.selected_shape.position.z:.2f}")
+            shape = self.selected_shape
+            set_var = self._set_if_changed
+            set_var(self.pos_x_var, f"{shape.position.x:.2f}")
+            set_var(self.pos_y_var, f"{shape.position.y:.2f}")
+            set_var(self.pos_z_var, f"{shape.position.z:.2f}")
             
-            self.rot_x_var.set(f"{self.selected_shape.rotation.x:.2f}")
-            self.rot_y_var.set(f"{self.selected_shape.rotation.y:.2f}")
-            self.rot_z_var.set(f"{self.selected_shape.rotation.z:.2f}")
+            set_var(self.rot_x_var, f"{shape.rotation.x:.2f}")
+            set_var(self.rot_y_var, f"{shape.rotation.y:.2f}")
+            set_var(self.rot_z_var, f"{shape.rotation.z:.2f}")
             
-            self.scale_x_var.set(f"{self.selected_shape.scale.x:.2f}")
-            self.scale_y_var.set(f"{self.selected_shape.scale.y:.2f}")
-            self.scale_z_var.set(f"{self.selected_shape.scale.z:.2f}")
+            set_var(self.scale_x_var, f"{shape.scale.x:.2f}")
+            set_var(self.scale_y_var, f"{shape.scale.y:.2f}")
+            set_var(self.scale_z_var, f"{shape.scale.z:.2f}")
             
-            self.size_var.set(f"{self.selected_shape.size:.2f}")
+            set_var(self.size_var, f"{shape.size:.2f}")
             
             # Update collision checkbox and button
-            self.collision_var.set(self.selected_shape.has_collision)
-            if self.selected_shape.has_collision:
+            set_var(self.collision_var, shape.has_collision)
+            if shape.has_collision:
                 self.collision_btn.config(bg="#4caf50")
             else:
                 self.collision_btn.config(bg="#3c3c3c")
     
+    @staticmethod
+    def _set_if_changed(var, value):
+        """Set a Tk variable only if it differs, sparing its widgets a redraw
+        
+        A gizmo drag refreshes the panel on every mouse move but changes a
+        single field, so most of the writes would repeat the shown value.
+        The variable itself is compared, not a remembered value, so text
+        typed into an entry is still overwritten.
+        """
+        if var.get() != value:
+            var.set(value)
+    
     def update_transform(self, event=None):
         """Update selected shape from property panel"""
         if not self.selected_shape:
@@ -1201,66 +1398,171 @@ class Viewport3D:
             
             self.selected_shape.size = float(self.size_var.get())
             
-            self.render()
+            self.schedule_render()
         except ValueError:
             pass
     
     def project_3d_to_2d(self, point: Vector3D) -> Tuple[float, float]:
         """Project 3D point to 2D screen coordinates"""
-        # Simple perspective projection
+        return self.project_points((point,))[0]
+    
+    def camera_key(self) -> tuple:
+        """Everything project_points depends on besides the points
+        
+        Two calls return equal keys only if projecting the same points
+        would give the same result, so cached projections can be reused.
+        """
+        camera = self.camera
+        return (camera.position.x, camera.position.y, camera.position.z,
+                camera.is_first_person, camera.yaw, camera.pitch, camera.rotation.y,
+                camera.near, camera.fov, self.width, self.height)
+    
+    def project_shape(self, shape: Shape3D):
+        """World vertices of a shape and their projections, cached
+        
+        A shape that has not moved, seen from a camera that has not moved,
+        reuses the previous frame's result instead of rebuilding and
+        reprojecting every vertex.
+        """
+        position, rotation, scale = shape.position, shape.rotation, shape.scale
+        key = (type(shape), shape.size, getattr(shape, 'segments', None),
+               position.x, position.y, position.z,
+               rotation.x, rotation.y, rotation.z,
+               scale.x, scale.y, scale.z, self.camera_key())
+        cache = self._projection_cache
+        cached = cache.get(id(shape))
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
         
-        # Transform to camera space
-        rel = Vector3D(
-            point.x - self.camera.position.x,
-            point.y - self.camera.position.y,
-            point.z - self.camera.position.z
-        )
-        
-        # Apply camera rotation
-        if self.camera.is_first_person:
-            # First-person: use pitch and yaw
-            # Rotate around Y (yaw)
-            yaw_rad = math.radians(self.camera.yaw)
-            x = rel.x * math.cos(yaw_rad) - rel.z * math.sin(yaw_rad)
-            z = rel.x * math.sin(yaw_rad) + rel.z * math.cos(yaw_rad)
-            rel = Vector3D(x, rel.y, z)
-            
-            # Rotate around X (pitch)
-            pitch_rad = math.radians(self.camera.pitch)
-            y = rel.y * math.cos(pitch_rad) - rel.z * math.sin(pitch_rad)
-            z = rel.y * math.sin(pitch_rad) + rel.z * math.cos(pitch_rad)
-            rel = Vector3D(rel.x, y, z)
+        vertices = shape.get_vertices()
+        projected = self.project_points(vertices)
+        # Entries of deleted shapes are dropped wholesale once they pile up
+        if len(cache) > 2 * len(self.shapes) + 16:
+            cache.clear()
+        cache[id(shape)] = (key, vertices, projected)
+        return vertices, projected
+    
+    def camera_basis(self) -> Tuple[float, ...]:
+        """Camera position and rotation sin/cos used to reach camera space
+        
+        Returns (x, y, z, cos_yaw, sin_yaw, cos_pitch, sin_pitch). Yaw is
+        camera.yaw in first-person mode and camera.rotation.y otherwise;
+        pitch only applies in first-person mode.
+        """
+        camera = self.camera
+        if camera.is_first_person:
+            yaw_rad = math.radians(camera.yaw)
+            pitch_rad = math.radians(camera.pitch)
+            cos_p, sin_p = math.cos(pitch_rad), math.sin(pitch_rad)
         else:
-            # Trajectory mode: use rotation.y
-            angle = math.radians(self.camera.rotation.y)
-            x = rel.x * math.cos(angle) - rel.z * math.sin(angle)
-            z = rel.x * math.sin(angle) + rel.z * math.cos(angle)
-            rel = Vector3D(x, rel.y, z)
+            yaw_rad = math.radians(camera.rotation.y)
+            cos_p, sin_p = 1.0, 0.0
+        return (camera.position.x, camera.position.y, camera.position.z,
+                math.cos(yaw_rad), math.sin(yaw_rad), cos_p, sin_p)
+    
+    def shape_in_view(self, shape: Shape3D) -> bool:
+        """Whether any part of a shape's bounding sphere can be on screen
+        
+        Conservative: False guarantees none of the shape's faces or edges
+        reach the viewport, so its vertices need not even be computed.
+        """
+        cam_x, cam_y, cam_z, cos_y, sin_y, cos_p, sin_p = self.camera_basis()
+        radius = shape.bounding_radius()
+        
+        # Shape center in camera space, same rotation as project_points
+        rx = shape.position.x - cam_x
+        ry = shape.position.y - cam_y
+        rz = shape.position.z - cam_z
+        x = rx * cos_y - rz * sin_y
+        z = rx * sin_y + rz * cos_y
+        y = ry * cos_p - z * sin_p
+        z = ry * sin_p + z * cos_p
+        
+        # Entirely behind the near plane
+        if z + radius <= self.camera.near:
+            return False
+        
+        # Entirely past a side plane: a point is on screen when |x| * f <= z
+        # (likewise y) with f = 1 / tan(fov / 2), and its signed distance
+        # from that plane is (|x| * f - z) / sqrt(f^2 + 1)
+        f = 1.0 / math.tan(math.radians(self.camera.fov / 2))
+        plane_norm = math.sqrt(f * f + 1.0)
+        if (abs(x) * f - z) / plane_norm > radius:
+            return False
+        if (abs(y) * f - z) / plane_norm > radius:
+            return False
+        return True
+    
+    def project_points(self, points) -> List[Optional[Tuple[float, float]]]:
+        """Project many 3D points to 2D screen coordinates
+        
+        Simple perspective projection. The camera's sin/cos and the screen
+        scale are worked out once per call rather than once per point, and
+        points go through camera space as plain floats. Points behind the
+        near plane map to None.
+        """
+        cam_x, cam_y, cam_z, cos_y, sin_y, cos_p, sin_p = self.camera_basis()
+        near = self.camera.near
+        half_w = self.width / 2
+        half_h = self.height / 2
+        fov_factor = 1.0 / math.tan(math.radians(self.camera.fov / 2))
+        scale_x = fov_factor * half_w
+        scale_y = fov_factor * half_h
         
-        # Perspective divide
-        if rel.z > self.camera.near:
-            fov_factor = 1.0 / math.tan(math.radians(self.camera.fov / 2))
-            
-            screen_x = rel.x / rel.z * fov_factor * self.width / 2 + self.width / 2
-            screen_y = -rel.y / rel.z * fov_factor * self.height / 2 + self.height / 2
-            
-            return (screen_x, screen_y)
+        projected = []
+        for point in points:
+            # Transform to camera space
+            rx = point.x - cam_x
+            ry = point.y - cam_y
+            rz = point.z - cam_z
+            
+            x = rx * cos_y - rz * sin_y
+            z = rx * sin_y + rz * cos_y
+            y = ry * cos_p - z * sin_p
+            z = ry * sin_p + z * cos_p
+            
+            # Perspective divide
+            if z > near:
+                projected.append((x / z * scale_x + half_w, -y / z * scale_y + half_h))
+            else:
+                projected.append(None)
         
-        return None
+        return projected
+    
+    def schedule_render(self):
+        """Queue one redraw for the next idle so a burst of UI edits renders once"""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.canvas.after_idle(self._do_render)
+    
+    def _do_render(self):
+        """Run the queued redraw unless a frame has been drawn since"""
+        if self._render_pending:
+            self.render()
     
     def render(self):
         """Render the 3D scene"""
-        self.canvas.delete("all")
+        self._render_pending = False
+        
+        # The grid's line items are kept across frames and only moved when
+        # the camera changes; the axes and shapes reuse last frame's items
+        # through draw_item(), and overlay texts are kept by hud_text().
+        # Everything else is redrawn
+        self.canvas.delete("!grid&&!scene&&!hud")
+        self._hud_drawn = set()
         
         # Draw grid
         self.draw_grid()
         
         # Draw axes
+        self._scene_cursor = 0
         self.draw_axes()
         
-        # Draw all shapes
-        for shape in self.shapes:
+        # Draw all shapes, farthest first
+        for shape in self.depth_sorted(self.shapes):
             self.draw_shape(shape)
+        self.trim_scene_items(self._scene_cursor)
         
         # Draw gizmo if object is selected
         # Always show in trajectory mode, AND show in Builder mode too!
@@ -1274,165 +1576,111 @@ class Viewport3D:
         else:
             # Draw camera info in trajectory mode
             self.draw_camera_info()
+        
+        self.finish_hud()
+    
+    def depth_sorted(self, shapes) -> List[Shape3D]:
+        """Shapes ordered back to front for the painter's algorithm
+        
+        Filled faces are back-face culled and every filled shape is convex,
+        so faces never need sorting within a shape; ordering the shapes by
+        the camera-space depth of their centers (one sort per frame) lets
+        nearer shapes cover farther ones. Static planes are the ground and
+        always go first. The sort is stable, so equal depths keep scene
+        order.
+        """
+        cam_x, cam_y, cam_z, cos_y, sin_y, cos_p, sin_p = self.camera_basis()
+        
+        def far_first(shape):
+            if isinstance(shape, Plane) and shape.is_static:
+                return -math.inf
+            rx = shape.position.x - cam_x
+            ry = shape.position.y - cam_y
+            rz = shape.position.z - cam_z
+            z = rx * sin_y + rz * cos_y
+            return -(ry * sin_p + z * cos_p)
+        
+        return sorted(shapes, key=far_first)
     
     def draw_grid(self):
-        """Draw ground grid"""
+        """Draw ground grid
+        
+        The grid's canvas items are created once, tagged "grid" so render()
+        keeps them, and stay below everything drawn after them. The grid is
+        static, so its items are only moved when the camera changes.
+        """
+        key = self.camera_key()
+        if self._grid_items and self._grid_key == key:
+            return
+        self._grid_key = key
+        
         grid_size = 10
         grid_spacing = 1
+        extent = grid_size * grid_spacing
         
+        # Endpoints of every grid line, projected in a single batch so the
+        # camera basis is worked out once for the whole grid
+        points = []
         for i in range(-grid_size, grid_size + 1):
+            offset = i * grid_spacing
             # Lines parallel to X
-            start = Vector3D(i * grid_spacing, 0, -grid_size * grid_spacing)
-            end = Vector3D(i * grid_spacing, 0, grid_size * grid_spacing)
-            
-            p1 = self.project_3d_to_2d(start)
-            p2 = self.project_3d_to_2d(end)
-            
-            if p1 and p2:
-                self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                       fill="#333333", width=1)
-            
+            points.append(Vector3D(offset, 0, -extent))
+            points.append(Vector3D(offset, 0, extent))
             # Lines parallel to Z
-            start = Vector3D(-grid_size * grid_spacing, 0, i * grid_spacing)
-            end = Vector3D(grid_size * grid_spacing, 0, i * grid_spacing)
-            
-            p1 = self.project_3d_to_2d(start)
-            p2 = self.project_3d_to_2d(end)
-            
-            if p1 and p2:
-                self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                       fill="#333333", width=1)
+            points.append(Vector3D(-extent, 0, offset))
+            points.append(Vector3D(extent, 0, offset))
+        projected = self.project_points(points)
+        
+        if not self._grid_items:
+            for _ in range(len(projected) // 2):
+                self._grid_items.append(self.canvas.create_line(
+                    0, 0, 0, 0, fill="#333333", width=1, tags="grid"))
+                self._grid_hidden.append(False)
+        
+        # Move every line; a line with an endpoint behind the camera is
+        # hidden rather than deleted, toggling state only when it changes
+        for n, item in enumerate(self._grid_items):
+            p1 = projected[2 * n]
+            p2 = projected[2 * n + 1]
+            hidden = not (p1 and p2)
+            if not hidden:
+                self.canvas.coords(item, p1[0], p1[1], p2[0], p2[1])
+            if hidden != self._grid_hidden[n]:
+                self.canvas.itemconfigure(item, state=tk.HIDDEN if hidden else tk.NORMAL)
+                self._grid_hidden[n] = hidden
     
     def draw_axes(self):
         """Draw XYZ axes"""
-        origin = Vector3D(0, 0, 0)
-        
-        # X axis (red)
-        x_end = Vector3D(2, 0, 0)
-        p1 = self.project_3d_to_2d(origin)
-        p2 = self.project_3d_to_2d(x_end)
-        if p1 and p2:
-            self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                   fill="#ff0000", width=2, arrow=tk.LAST)
-        
-        # Y axis (green)
-        y_end = Vector3D(0, 2, 0)
-        p2 = self.project_3d_to_2d(y_end)
-        if p1 and p2:
-            self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                   fill="#00ff00", width=2, arrow=tk.LAST)
-        
-        # Z axis (blue)
-        z_end = Vector3D(0, 0, 2)
-        p2 = self.project_3d_to_2d(z_end)
-        if p1 and p2:
-            self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                   fill="#0000ff", width=2, arrow=tk.LAST)
+        # Origin, then the X (red), Y (green) and Z (blue) axis tips
+        p1, x_end, y_end, z_end = self.project_points((
+            Vector3D(0, 0, 0), Vector3D(2, 0, 0), Vector3D(0, 2, 0), Vector3D(0, 0, 2)
+        ))
+        if not p1:
+            return
+        
+        for p2, color in ((x_end, "#ff0000"), (y_end, "#00ff00"), (z_end, "#0000ff")):
+            if p2:
+                self.draw_item('line', (p1[0], p1[1], p2[0], p2[1]),
+                               '-fill', color, '-width', 2, '-arrow', tk.LAST)
     
     def draw_shape(self, shape: Shape3D):
         """Draw a 3D shape"""
-        vertices = shape.get_vertices()
-        edges = shape.get_edges()
+        if not self.shape_in_view(shape):
+            self.draw_collision_badge(shape)
+            return
         
-        # Project vertices
-        projected = []
-        for v in vertices:
-            p = self.project_3d_to_2d(v)
-            projected.append(p)
+        # World vertices and their projections
+        vertices, projected = self.project_shape(shape)
         
         # Determine line width and style
         width = 2 if shape == self.selected_shape else 1
         color = shape.color
         
         # FILLED RENDERING (if shape.filled is True)
-        if shape.filled and hasattr(shape, 'get_faces'):
-            faces = shape.get_faces()
-            
-            for face in faces:
-                # Get projected points for this face
-                face_points = []
-                valid_face = True
-                for idx in face:
-                    if idx < len(projected) and projected[idx]:
-                        face_points.append(projected[idx])
-                    else:
-                        valid_face = False
-                        break
-                
-                if valid_face and len(face_points) >= 3:
-                    # Calculate face normal for shading
-                    # Get 3D vertices for normal calculation
-                    v0 = vertices[face[0]]
-                    v1 = vertices[face[1]]
-                    v2 = vertices[face[2]]
-                    
-                    # Two edges of the face
-                    edge1 = Vector3D(v1.x - v0.x, v1.y - v0.y, v1.z - v0.z)
-                    edge2 = Vector3D(v2.x - v0.x, v2.y - v0.y, v2.z - v0.z)
-                    
-                    # Cross product to get normal
-                    normal = Vector3D(
-                        edge1.y * edge2.z - edge1.z * edge2.y,
-                        edge1.z * edge2.x - edge1.x * edge2.z,
-                        edge1.x * edge2.y - edge1.y * edge2.x
-                    )
-                    
-                    # Normalize
-                    normal_len = math.sqrt(normal.x**2 + normal.y**2 + normal.z**2)
-                    if normal_len > 0:
-                        normal.x /= normal_len
-                        normal.y /= normal_len
-                        normal.z /= normal_len
-                    
-                    # Camera direction (view vector)
-                    face_center = Vector3D(
-                        (v0.x + v1.x + v2.x) / 3,
-                        (v0.y + v1.y + v2.y) / 3,
-                        (v0.z + v1.z + v2.z) / 3
-                    )
-                    
-                    view_dir = Vector3D(
-                        self.camera.position.x - face_center.x,
-                        self.camera.position.y - face_center.y,
-                        self.camera.position.z - face_center.z
-                    )
-                    
-                    view_len = math.sqrt(view_dir.x**2 + view_dir.y**2 + view_dir.z**2)
-                    if view_len > 0:
-                        view_dir.x /= view_len
-                        view_dir.y /= view_len
-                        view_dir.z /= view_len
-                    
-                    # Dot product for shading (how much face faces camera)
-                    dot = normal.x * view_dir.x + normal.y * view_dir.y + normal.z * view_dir.z
-                    
-                    # Only draw faces facing camera (backface culling)
-                    if dot > 0:
-                        # Calculate brightness based on angle
-                        brightness = abs(dot) * shape.light_level
-                        brightness = max(0.2, min(1.0, brightness))  # Clamp between 0.2 and 1.0
-                        
-                        # Adjust color based on brightness
-                        # Parse hex color
-                        hex_color = shape.color.lstrip('#')
-                        r = int(hex_color[0:2], 16)
-                        g = int(hex_color[2:4], 16)
-                        b = int(hex_color[4:6], 16)
-                        
-                        # Apply brightness
-                        r = int(r * brightness)
-                        g = int(g * brightness)
-                        b = int(b * brightness)
-                        
-                        shaded_color = f'#{r:02x}{g:02x}{b:02x}'
-                        
-                        # Draw filled polygon
-                        flat_points = []
-                        for px, py in face_points:
-                            flat_points.extend([px, py])
-                        
-                        self.canvas.create_polygon(flat_points, fill=shaded_color, 
-                                                   outline=shaded_color, width=1)
+        if shape.filled:
+            for flat_points, shaded_color in self.shade_faces(shape, vertices, projected):
+                self.draw_item('polygon', flat_points, '-fill', shaded_color,
+                               '-outline', shaded_color, '-width', 1)
         
         # WIREFRAME RENDERING (always draw edges on top or if not filled)
         # Draw collision indicator (dashed lines for collision objects)
@@ -1443,24 +1691,209 @@ class Viewport3D:
         
         # Only draw wireframe if not filled, or draw outline if filled
         if not shape.filled or shape == self.selected_shape:
-            # Draw edges
-            for edge in edges:
-                if edge[0] < len(projected) and edge[1] < len(projected):
-                    p1 = projected[edge[0]]
-                    p2 = projected[edge[1]]
-                    
-                    if p1 and p2:
-                        edge_color = color if not shape.filled else "#ffffff"
-                        self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                               fill=edge_color, width=width, dash=dash_pattern)
+            edge_color = color if not shape.filled else "#ffffff"
+            for coords in self.edge_polylines(shape, projected):
+                self.draw_item('line', coords, '-fill', edge_color,
+                               '-width', width, '-dash', dash_pattern)
+        
+        self.draw_collision_badge(shape)
+    
+    def draw_item(self, item_type: str, coords, *options):
+        """Draw the next scene item from flat coordinates and "-name", value options
+        
+        render() draws the axes, shapes and collision badges through here,
+        back to front, and each call fills the next slot of _scene_items.
+        When last frame's item in that slot has the same type and option
+        names it is kept: its coordinates and options are only sent to Tk
+        if they changed, so a still shape whose cached coordinates are
+        handed back costs no Tcl call at all. Slots keep their stacking
+        order, so the painter's algorithm still holds. From the first slot
+        that does not fit, the old items are deleted and new ones created.
+        
+        Goes straight to Tcl: Canvas.create_line and friends flatten their
+        arguments and convert keyword options on every call, which costs
+        more than building the coordinates of a typical edge strip.
+        """
+        call = self.canvas.tk.call
+        path = self.canvas._w
+        items = self._scene_items
+        slot = self._scene_cursor
+        self._scene_cursor = slot + 1
+        kind = (item_type, options[::2])
+        
+        if slot < len(items):
+            old_kind, item, old_coords, old_options = items[slot]
+            if old_kind == kind:
+                if coords is not old_coords and coords != old_coords:
+                    call(path, 'coords', item, *coords)
+                if options != old_options:
+                    call(path, 'itemconfigure', item, *options)
+                items[slot] = (kind, item, coords, options)
+                return
+            self.trim_scene_items(slot)
+        
+        item = call(path, 'create', item_type, *coords, *options, '-tags', 'scene')
+        items.append((kind, item, coords, options))
+    
+    def trim_scene_items(self, count: int):
+        """Delete the scene items past the first count slots"""
+        items = self._scene_items
+        if len(items) > count:
+            self.canvas.tk.call(self.canvas._w, 'delete', *[entry[1] for entry in items[count:]])
+            del items[count:]
+    
+    def edge_polylines(self, shape: Shape3D, projected) -> list:
+        """Flat screen coordinates of a shape's wireframe, one list per line
+        
+        Edges are drawn as one canvas line per connected strip of edges. A
+        strip is split wherever a vertex is off-screen, which leaves out
+        exactly the edges that touch that vertex. Like shade_faces, the
+        result is kept for as long as project_shape() hands back the same
+        projected list.
+        """
+        cached = self._edge_cache.get(id(shape))
+        if cached is not None and cached[0] is projected:
+            return cached[1]
+        
+        count = len(projected)
+        polylines = []
+        for strip in shape.get_edge_strips():
+            coords = []
+            for idx in strip:
+                p = projected[idx] if idx < count else None
+                if p:
+                    coords.extend(p)
+                    continue
+                if len(coords) >= 4:
+                    polylines.append(coords)
+                coords = []
+            if len(coords) >= 4:
+                polylines.append(coords)
+        
+        if len(self._edge_cache) > 2 * len(self.shapes) + 16:
+            self._edge_cache.clear()
+        self._edge_cache[id(shape)] = (projected, polylines)
+        return polylines
+    
+    def shade_faces(self, shape: Shape3D, vertices, projected) -> list:
+        """Screen polygons and shaded colors of a shape's camera-facing faces
+        
+        All faces are worked out in one pass with the color parse, sqrt and
+        camera position hoisted, then ordered farthest first by the distance
+        from the camera to each face center, so faces that overlap on screen
+        paint correctly (painter's algorithm).
+        
+        The result is kept until the shape's projection, color or light
+        level changes: project_shape() hands back the same projected list
+        only while neither the shape nor the camera has moved, so a still
+        frame redraws its faces without any math.
+        """
+        color, light_level = shape.color, shape.light_level
+        cached = self._face_cache.get(id(shape))
+        if (cached is not None and cached[0] is projected
+                and cached[1] == color and cached[2] == light_level):
+            return cached[3]
+        
+        faces = shape.get_faces()
+        count = len(projected)
+        base_r, base_g, base_b = parse_color(color)
+        sqrt = math.sqrt
+        cam = self.camera.position
+        polygons = []
+        
+        for face in faces:
+            if len(face) < 3:
+                continue
+            
+            # Calculate face normal for shading
+            # Get 3D vertices for normal calculation
+            v0 = vertices[face[0]]
+            v1 = vertices[face[1]]
+            v2 = vertices[face[2]]
+            
+            # Per-face math works on plain floats; no temporary
+            # Vector3D objects are needed for these intermediates
+            
+            # Two edges of the face
+            e1x, e1y, e1z = v1.x - v0.x, v1.y - v0.y, v1.z - v0.z
+            e2x, e2y, e2z = v2.x - v0.x, v2.y - v0.y, v2.z - v0.z
+            
+            # Cross product to get normal
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            
+            # Normalize
+            normal_len = sqrt(nx * nx + ny * ny + nz * nz)
+            if normal_len > 0:
+                nx /= normal_len
+                ny /= normal_len
+                nz /= normal_len
+            
+            # Camera direction (view vector from the face center)
+            vx = cam.x - (v0.x + v1.x + v2.x) / 3
+            vy = cam.y - (v0.y + v1.y + v2.y) / 3
+            vz = cam.z - (v0.z + v1.z + v2.z) / 3
+            
+            view_len = sqrt(vx * vx + vy * vy + vz * vz)
+            if view_len > 0:
+                vx /= view_len
+                vy /= view_len
+                vz /= view_len
+            
+            # Dot product for shading (how much face faces camera)
+            dot = nx * vx + ny * vy + nz * vz
+            
+            # Only draw faces facing camera (backface culling). Tested
+            # before the face's screen points are gathered, so hidden
+            # faces cost only the normal
+            if dot <= 0:
+                continue
+            
+            # Get projected points for this face
+            face_points = []
+            for idx in face:
+                p = projected[idx] if idx < count else None
+                if not p:
+                    break
+                face_points.append(p)
+            else:
+                # Calculate brightness based on angle
+                brightness = abs(dot) * light_level
+                brightness = max(0.2, min(1.0, brightness))  # Clamp between 0.2 and 1.0
+                
+                # Adjust color based on brightness
+                r = int(base_r * brightness)
+                g = int(base_g * brightness)
+                b = int(base_b * brightness)
+                
+                shaded_color = f'#{(r << 16) | (g << 8) | b:06x}'
+                
+                # Flatten for create_polygon
+                flat_points = []
+                for px, py in face_points:
+                    flat_points.extend([px, py])
+                
+                polygons.append((view_len, flat_points, shaded_color))
+        
+        # One sort per shape over the few visible faces; stable, so equal
+        # depths keep face order
+        polygons.sort(key=lambda polygon: -polygon[0])
+        polygons = [(flat_points, shaded_color) for _, flat_points, shaded_color in polygons]
         
-        # Draw collision badge if enabled
+        if len(self._face_cache) > 2 * len(self.shapes) + 16:
+            self._face_cache.clear()
+        self._face_cache[id(shape)] = (projected, color, light_level, polygons)
+        return polygons
+    
+    def draw_collision_badge(self, shape: Shape3D):
+        """Draw the shield badge above a collision shape"""
         if shape.has_collision and shape != self.selected_shape:
             center = self.project_3d_to_2d(shape.position)
             if center:
-                self.canvas.create_text(center[0], center[1] - 30, 
-                                       text="🛡️", font=("Arial", 16),
-                                       fill="#00ffff")
+                self.draw_item('text', (center[0], center[1] - 30),
+                               '-text', "🛡️", '-font', ("Arial", 16),
+                               '-fill', "#00ffff")
     
     def draw_hud(self):
         """Draw game mode HUD"""
@@ -1509,25 +1942,25 @@ class Viewport3D:
         if self.player:
             info = f"Position: ({self.player.position.x:.1f}, " \
                    f"{self.player.position.y:.1f}, {self.player.position.z:.1f})"
-            self.canvas.create_text(10, 10, text=info, anchor=tk.NW,
-                                   fill="white", font=("Consolas", 10))
+            self.hud_text('position', 10, 10, info, anchor=tk.NW,
+                          fill="white", font=("Consolas", 10))
             
             status = "On Ground" if self.player.on_ground else "In Air"
-            self.canvas.create_text(10, 30, text=f"Status: {status}",
-                                   anchor=tk.NW, fill="white",
-                                   font=("Consolas", 10))
+            self.hud_text('status', 10, 30, f"Status: {status}",
+                          anchor=tk.NW, fill="white",
+                          font=("Consolas", 10))
             
             # Camera angle info
             look_info = f"Look: Yaw {self.camera.yaw:.0f}° Pitch {self.camera.pitch:.0f}°"
-            self.canvas.create_text(10, 50, text=look_info,
-                                   anchor=tk.NW, fill="white",
-                                   font=("Consolas", 10))
+            self.hud_text('look', 10, 50, look_info,
+                          anchor=tk.NW, fill="white",
+                          font=("Consolas", 10))
             
             # Gameplay mode indicator
             mode_text = f"Mode: {self.gameplay_mode}"
-            self.canvas.create_text(10, 70, text=mode_text,
-                                   anchor=tk.NW, fill="#ffaa00",
-                                   font=("Consolas", 10, "bold"))
+            self.hud_text('mode', 10, 70, mode_text,
+                          anchor=tk.NW, fill="#ffaa00",
+                          font=("Consolas", 10, "bold"))
             
             # Controls reminder (varies by mode)
             if self.gameplay_mode == self.GAMEPLAY_MODE_SHOOTER:
@@ -1543,14 +1976,12 @@ class Viewport3D:
                 controls1 = "Arrow Keys: Look Around | Tab: Toggle View"
                 controls2 = "WASD: Move | Space: Jump | E: Interact"
             
-            self.canvas.create_text(10, self.height - 40, 
-                                   text=controls1,
-                                   anchor=tk.NW, fill="#888888",
-                                   font=("Consolas", 9))
-            self.canvas.create_text(10, self.height - 20,
-                                   text=controls2,
-                                   anchor=tk.NW, fill="#888888",
-                                   font=("Consolas", 9))
+            self.hud_text('controls1', 10, self.height - 40, controls1,
+                          anchor=tk.NW, fill="#888888",
+                          font=("Consolas", 9))
+            self.hud_text('controls2', 10, self.height - 20, controls2,
+                          anchor=tk.NW, fill="#888888",
+                          font=("Consolas", 9))
         
         # Draw weapon (Quake-style center gun)
         # Only show gun in Shooter mode
@@ -1643,17 +2074,17 @@ class Viewport3D:
         if hasattr(self.editor, 'interpreter'):
             ammo = self.editor.interpreter.variables.get('ammo', 30)
             magazine = self.editor.interpreter.variables.get('magazine', 30)
-            self.canvas.create_text(
-                self.width - 20, self.height - 80,
-                text=f"{ammo}/{magazine}",
+            self.hud_text(
+                'ammo', self.width - 20, self.height - 80,
+                f"{ammo}/{magazine}",
                 anchor=tk.E, fill="white",
                 font=("Consolas", 18, "bold")
             )
             
             # Ammo text
-            self.canvas.create_text(
-                self.width - 20, self.height - 60,
-                text="AMMO",
+            self.hud_text(
+                'ammo_label', self.width - 20, self.height - 60,
+                "AMMO",
                 anchor=tk.E, fill="#888888",
                 font=("Consolas", 10)
             )
@@ -1698,45 +2129,47 @@ class Viewport3D:
         ray_start = self.camera.position
         ray_length = 1000  # Max distance
         
-        # Check for hits
+        # Check for hits. Distances are compared squared; the only square
+        # roots are the ray direction's length and the final hit distance
         hit_target = None
-        closest_distance = ray_length
+        closest_distance_sq = ray_length * ray_length
+        
+        # Loop-invariant: one over the ray direction's length
+        inv_ray_dir_length = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
         
         for shape in self.shapes:
             if shape == self.player:
                 continue
             
             # Simple sphere/box intersection test
-            dx_to_shape = shape.position.x - ray_start.x
-            dy_to_shape = shape.position.y - ray_start.y
-            dz_to_shape = shape.position.z - ray_start.z
+            position = shape.position
+            dx_to_shape = position.x - ray_start.x
+            dy_to_shape = position.y - ray_start.y
+            dz_to_shape = position.z - ray_start.z
             
-            distance_to_shape = math.sqrt(dx_to_shape**2 + dy_to_shape**2 + dz_to_shape**2)
+            distance_sq = dx_to_shape * dx_to_shape + dy_to_shape * dy_to_shape + dz_to_shape * dz_to_shape
             
             # Check if ray points towards shape
             dot = dx_to_shape * dx + dy_to_shape * dy + dz_to_shape * dz
             
-            if dot > 0 and distance_to_shape < closest_distance:
+            if dot > 0 and distance_sq < closest_distance_sq:
                 # Simple collision: check if close enough to ray line
                 hit_threshold = shape.size * 1.5
                 
                 # Project point onto ray
-                projection_length = dot / math.sqrt(dx**2 + dy**2 + dz**2)
+                projection_length = dot * inv_ray_dir_length
                 
                 # Calculate distance from shape to ray line
-                proj_x = ray_start.x + dx * projection_length
-                proj_y = ray_start.y + dy * projection_length
-                proj_z = ray_start.z + dz * projection_length
+                off_x = position.x - (ray_start.x + dx * projection_length)
+                off_y = position.y - (ray_start.y + dy * projection_length)
+                off_z = position.z - (ray_start.z + dz * projection_length)
                 
-                dist_to_ray = math.sqrt(
-                    (shape.position.x - proj_x)**2 +
-                    (shape.position.y - proj_y)**2 +
-                    (shape.position.z - proj_z)**2
-                )
-                
-                if dist_to_ray < hit_threshold:
+                if (hit_threshold > 0 and
+                        off_x * off_x + off_y * off_y + off_z * off_z < hit_threshold * hit_threshold):
                     hit_target = shape
-                    closest_distance = distance_to_shape
+                    closest_distance_sq = distance_sq
+        
+        closest_distance = math.sqrt(closest_distance_sq)
         
         # Process hit
         if hit_target:
@@ -1756,8 +2189,7 @@ class Viewport3D:
                     self.editor.log(f"☠️ {hit_target.name} eliminated!", "success")
                     
                     # Remove from scene
-                    if hit_target in self.shapes:
-                        self.shapes.remove(hit_target)
+                    self.shapes.discard(hit_target)
                     
                     # Add score and kills
                     if hasattr(self.editor, 'interpreter'):
@@ -1772,14 +2204,12 @@ class Viewport3D:
                     # Flash NPC (still alive)
                     original_color = hit_target.color
                     hit_target.color = "#ffff00"
-                    self.render()
                     self.canvas.after(100, lambda: self.restore_hit_color(hit_target, original_color))
             else:
                 self.editor.log(f"💥 Hit object!", "success")
                 # Flash object
                 original_color = hit_target.color
                 hit_target.color = "#ff0000"
-                self.render()
                 self.canvas.after(100, lambda: self.restore_hit_color(hit_target, original_color))
         else:
             self.editor.log("💨 Miss!", "info")
@@ -1787,13 +2217,13 @@ class Viewport3D:
         # Visual feedback - draw laser beam briefly
         self.draw_laser_beam(ray_start, dx, dy, dz, closest_distance)
         
-        # Render to show muzzle flash
-        self.render()
+        # Render to show muzzle flash and any hit flash
+        self.schedule_render()
     
     def restore_hit_color(self, shape, color):
         """Restore shape color after hit"""
         shape.color = color
-        self.render()
+        self.schedule_render()
     
     def draw_laser_beam(self, start, dx, dy, dz, length):
         """Draw laser beam for visual feedback"""
@@ -1803,9 +2233,8 @@ class Viewport3D:
         end_z = start.z + dz * length
         
         # Project both points to screen
-        start_2d = self.project_3d_to_2d(start)
         end_point = Vector3D(end_x, end_y, end_z)
-        end_2d = self.project_3d_to_2d(end_point)
+        start_2d, end_2d = self.project_points((start, end_point))
         
         if start_2d and end_2d:
             # Draw laser line
@@ -1823,24 +2252,58 @@ class Viewport3D:
         if self.mode == self.MODE_TRAJECTORY:
             cam_info = f"Camera: ({self.camera.position.x:.1f}, " \
                       f"{self.camera.position.y:.1f}, {self.camera.position.z:.1f})"
-            self.canvas.create_text(10, 10, text=cam_info, anchor=tk.NW,
-                                   fill="#888888", font=("Consolas", 9))
+            self.hud_text('camera', 10, 10, cam_info, anchor=tk.NW,
+                          fill="#888888", font=("Consolas", 9))
             
             rot_info = f"Rotation: ({self.camera.rotation.x:.0f}°, " \
                       f"{self.camera.rotation.y:.0f}°, {self.camera.rotation.z:.0f}°)"
-            self.canvas.create_text(10, 25, text=rot_info, anchor=tk.NW,
-                                   fill="#888888", font=("Consolas", 9))
+            self.hud_text('rotation', 10, 25, rot_info, anchor=tk.NW,
+                          fill="#888888", font=("Consolas", 9))
             
             # Object count
             obj_count = f"Objects: {len(self.shapes)}"
-            self.canvas.create_text(10, 40, text=obj_count, anchor=tk.NW,
-                                   fill="#888888", font=("Consolas", 9))
+            self.hud_text('objects', 10, 40, obj_count, anchor=tk.NW,
+                          fill="#888888", font=("Consolas", 9))
+    
+    def hud_text(self, key: str, x: float, y: float, text: str, **options):
+        """Show an overlay text item that is kept across frames under key
+        
+        The item is created on first use with the given options, which must
+        be the same every time for a key. Later frames only move it or
+        change its text when those differ, instead of creating a new text
+        item each frame. finish_hud() hides the keys a frame did not draw.
+        """
+        entry = self._hud_items.get(key)
+        if entry is None:
+            item = self.canvas.create_text(x, y, text=text, tags="hud", **options)
+            self._hud_items[key] = [item, (x, y), text, True]
+        else:
+            item, coords, old_text, shown = entry
+            if coords != (x, y):
+                self.canvas.coords(item, x, y)
+                entry[1] = (x, y)
+            if old_text != text:
+                self.canvas.itemconfigure(item, text=text)
+                entry[2] = text
+            if not shown:
+                self.canvas.itemconfigure(item, state=tk.NORMAL)
+                entry[3] = True
+        self._hud_drawn.add(key)
+    
+    def finish_hud(self):
+        """Hide overlay texts not drawn this frame and keep the rest on top"""
+        for key, entry in self._hud_items.items():
+            if entry[3] and key not in self._hud_drawn:
+                self.canvas.itemconfigure(entry[0], state=tk.HIDDEN)
+                entry[3] = False
+        if self._hud_drawn:
+            self.canvas.tag_raise("hud")
     
     def on_resize(self, event):
         """Handle canvas resize"""
         self.width = event.width
         self.height = event.height
-        self.render()
+        self.schedule_render()
     
     def on_mouse_down(self, event):
         """Handle mouse down"""
@@ -1881,7 +2344,7 @@ class Viewport3D:
             self.gizmo_visible = True
             self.update_property_panel()
             self.editor.log(f"Selected {type(clicked_shape).__name__}", "info")
-            self.render()
+            self.schedule_render()
             return
         
         # Otherwise, start camera rotation (only if not in first person)
@@ -1923,7 +2386,7 @@ class Viewport3D:
                 self.selected_shape.size = max(0.1, self.drag_start_object_pos + delta)
             
             self.update_property_panel()
-            self.render()
+            self.schedule_render()
             return
         
         # Camera rotation
@@ -1934,7 +2397,7 @@ class Viewport3D:
             self.mouse_x = event.x
             self.mouse_y = event.y
             
-            self.render()
+            self.schedule_render()
     
     def on_mouse_up(self, event):
         """Handle mouse up"""
@@ -1962,7 +2425,7 @@ class Viewport3D:
             self.mouse_x = event.x
             self.mouse_y = event.y
             
-            self.render()
+            self.schedule_render()
     
     def on_middle_mouse_up(self, event):
         """Handle middle mouse up"""
@@ -1985,7 +2448,7 @@ class Viewport3D:
         # Simple zoom: move along Z axis
         self.camera.position.z += zoom_factor
         
-        self.render()
+        self.schedule_render()
     
     def on_key_press(self, event):
         """Handle key press"""
@@ -2112,12 +2575,12 @@ class Viewport3D:
     def on_canvas_focus_in(self, event):
         """Canvas gained focus"""
         self.canvas_has_focus = True
-        self.render()  # Re-render to remove focus warning
+        self.schedule_render()  # Re-render to remove focus warning
     
     def on_canvas_focus_out(self, event):
         """Canvas lost focus"""
         self.canvas_has_focus = False
-        self.render()  # Re-render to show focus warning
+        self.schedule_render()  # Re-render to show focus warning
     
     def on_canvas_enter(self, event):
         """Mouse entered canvas - auto-grab focus in game mode"""
@@ -2138,42 +2601,27 @@ class Viewport3D:
         
         moved = False
         
-        # Only allow camera movement in trajectory mode or when not in first person
-        if self.mode == self.MODE_TRAJECTORY or not self.camera.is_first_person:
-            # WASD for camera movement in viewport
-            if 'w' in self.keys_pressed:
-                self.camera.position.z += self.camera_speed
-                moved = True
-            if 's' in self.keys_pressed:
-                self.camera.position.z -= self.camera_speed
-                moved = True
-            if 'a' in self.keys_pressed:
-                self.camera.position.x -= self.camera_speed
-                moved = True
-            if 'd' in self.keys_pressed:
-                self.camera.position.x += self.camera_speed
-                moved = True
-            
-            # Q/E for vertical movement
-            if 'q' in self.keys_pressed:
-                self.camera.position.y -= self.camera_speed
-                moved = True
-            if 'e' in self.keys_pressed:
-                self.camera.position.y += self.camera_speed
+        # Only allow camera movement in trajectory mode or when not in first
+        # person. With no keys held (the idle case) there is nothing to check
+        if self.keys_pressed and (self.mode == self.MODE_TRAJECTORY or not self.camera.is_first_person):
+            # WASD/QE for camera movement in viewport, summed into one step
+            move_x = move_y = move_z = 0
+            for key in self.keys_pressed.intersection(self.CAMERA_MOVE_KEYS):
+                step_x, step_y, step_z = self.CAMERA_MOVE_KEYS[key]
+                move_x += step_x
+                move_y += step_y
+                move_z += step_z
                 moved = True
+            if moved:
+                self.camera.position.x += move_x * self.camera_speed
+                self.camera.position.y += move_y * self.camera_speed
+                self.camera.position.z += move_z * self.camera_speed
             
             # Arrow keys for camera rotation
-            if 'left' in self.keys_pressed:
-                self.camera.rotation.y -= 2.0
-                moved = True
-            if 'right' in self.keys_pressed:
-                self.camera.rotation.y += 2.0
-                moved = True
-            if 'up' in self.keys_pressed:
-                self.camera.rotation.x -= 2.0
-                moved = True
-            if 'down' in self.keys_pressed:
-                self.camera.rotation.x += 2.0
+            for key in self.keys_pressed.intersection(self.CAMERA_TURN_KEYS):
+                turn_x, turn_y = self.CAMERA_TURN_KEYS[key]
+                self.camera.rotation.x += turn_x
+                self.camera.rotation.y += turn_y
                 moved = True
             
             # R to reset camera
@@ -2189,7 +2637,7 @@ class Viewport3D:
         # ========== ENEMY AI (FPS GAME) ==========
         # Make enemies chase player in Shooter mode
         if self.mode == self.MODE_GAME and self.player and self.player_controls_enabled and self.gameplay_mode == self.GAMEPLAY_MODE_SHOOTER:
-            import math
+            sqrt = math.sqrt
             
             # Damage cooldown
             if not hasattr(self, 'damage_cooldown_timer'):
@@ -2207,7 +2655,7 @@ class Viewport3D:
                 dx = self.player.position.x - shape.position.x
                 dy = self.player.position.y - shape.position.y
                 dz = self.player.position.z - shape.position.z
-                distance = math.sqrt(dx*dx + dy*dy + dz*dz)
+                distance = sqrt(dx*dx + dy*dy + dz*dz)
                 
                 # CHASE: Move toward player if within range
                 if distance > 0.5 and distance < 20:
@@ -2258,80 +2706,56 @@ class Viewport3D:
         if not self.selected_shape:
             return
         
+        # Object center and the three axis tips in one projection batch, so
+        # the camera basis is computed once for the whole gizmo
+        pos = self.selected_shape.position
+        points = [pos]
+        for _, (dx, dy, dz), _ in self.GIZMO_AXES:
+            points.append(Vector3D(pos.x + dx, pos.y + dy, pos.z + dz))
+        projected = self.project_points(points)
+        
         # Get object center in screen space
-        center = self.project_3d_to_2d(self.selected_shape.position)
+        center = projected[0]
         if not center:
             return
         
         cx, cy = center
-        arrow_length = 60
         arrow_head = 10
+        barb_cos = self.GIZMO_BARB_COS
+        barb_sin = self.GIZMO_BARB_SIN
         
-        # X axis - RED
-        x_end = self.project_3d_to_2d(Vector3D(
-            self.selected_shape.position.x + 1,
-            self.selected_shape.position.y,
-            self.selected_shape.position.z
-        ))
-        if x_end:
+        # Everything past the projection is plain 2D screen-space work: the
+        # arrow head comes from the shaft direction, with no atan2/sin/cos
+        for (axis, _, color), end in zip(self.GIZMO_AXES, projected[1:]):
+            if not end:
+                continue
+            head_x, head_y = end
+            tag = "gizmo_" + axis
+            
             # Draw arrow shaft
-            self.canvas.create_line(cx, cy, x_end[0], x_end[1],
-                                   fill="#ff0000", width=3, tags="gizmo_x")
+            self.canvas.create_line(cx, cy, head_x, head_y,
+                                   fill=color, width=3, tags=tag)
+            
             # Draw arrow head
-            angle = math.atan2(x_end[1] - cy, x_end[0] - cx)
-            head_x = x_end[0]
-            head_y = x_end[1]
+            dx = head_x - cx
+            dy = head_y - cy
+            length = math.sqrt(dx * dx + dy * dy)
+            if length > 0:
+                ux, uy = dx / length, dy / length
+            else:
+                ux, uy = 1.0, 0.0
             self.canvas.create_polygon(
                 head_x, head_y,
-                head_x - arrow_head * math.cos(angle - 0.5), head_y - arrow_head * math.sin(angle - 0.5),
-                head_x - arrow_head * math.cos(angle + 0.5), head_y - arrow_head * math.sin(angle + 0.5),
-                fill="#ff0000", outline="#ff0000", tags="gizmo_x"
+                head_x - arrow_head * (ux * barb_cos + uy * barb_sin),
+                head_y - arrow_head * (uy * barb_cos - ux * barb_sin),
+                head_x - arrow_head * (ux * barb_cos - uy * barb_sin),
+                head_y - arrow_head * (uy * barb_cos + ux * barb_sin),
+                fill=color, outline=color, tags=tag
             )
+            
             # Label
-            self.canvas.create_text(x_end[0] + 15, x_end[1], text="X", 
-                                   fill="#ff0000", font=("Arial", 12, "bold"), tags="gizmo_x")
-        
-        # Y axis - GREEN
-        y_end = self.project_3d_to_2d(Vector3D(
-            self.selected_shape.position.x,
-            self.selected_shape.position.y + 1,
-            self.selected_shape.position.z
-        ))
-        if y_end:
-            self.canvas.create_line(cx, cy, y_end[0], y_end[1],
-                                   fill="#00ff00", width=3, tags="gizmo_y")
-            angle = math.atan2(y_end[1] - cy, y_end[0] - cx)
-            head_x = y_end[0]
-            head_y = y_end[1]
-            self.canvas.create_polygon(
-                head_x, head_y,
-                head_x - arrow_head * math.cos(angle - 0.5), head_y - arrow_head * math.sin(angle - 0.5),
-                head_x - arrow_head * math.cos(angle + 0.5), head_y - arrow_head * math.sin(angle + 0.5),
-                fill="#00ff00", outline="#00ff00", tags="gizmo_y"
-            )
-            self.canvas.create_text(y_end[0] + 15, y_end[1], text="Y",
-                                   fill="#00ff00", font=("Arial", 12, "bold"), tags="gizmo_y")
-        
-        # Z axis - BLUE
-        z_end = self.project_3d_to_2d(Vector3D(
-            self.selected_shape.position.x,
-            self.selected_shape.position.y,
-            self.selected_shape.position.z + 1
-        ))
-        if z_end:
-            self.canvas.create_line(cx, cy, z_end[0], z_end[1],
-                                   fill="#0088ff", width=3, tags="gizmo_z")
-            angle = math.atan2(z_end[1] - cy, z_end[0] - cx)
-            head_x = z_end[0]
-            head_y = z_end[1]
-            self.canvas.create_polygon(
-                head_x, head_y,
-                head_x - arrow_head * math.cos(angle - 0.5), head_y - arrow_head * math.sin(angle - 0.5),
-                head_x - arrow_head * math.cos(angle + 0.5), head_y - arrow_head * math.sin(angle + 0.5),
-                fill="#0088ff", outline="#0088ff", tags="gizmo_z"
-            )
-            self.canvas.create_text(z_end[0] + 15, z_end[1], text="Z",
-                                   fill="#0088ff", font=("Arial", 12, "bold"), tags="gizmo_z")
+            self.canvas.create_text(head_x + 15, head_y, text=axis.upper(),
+                                   fill=color, font=("Arial", 12, "bold"), tags=tag)
     
     def check_gizmo_click(self, x, y):
         """Check if mouse click is on a gizmo arrow"""
@@ -2355,11 +2779,11 @@ class Viewport3D:
         min_dist = 50  # Pixel threshold
         closest_shape = None
         
-        for shape in self.shapes:
-            if isinstance(shape, Plane):
-                continue  # Skip planes for selection
-            
-            center = self.project_3d_to_2d(shape.position)
+        # Skip planes for selection; project every other center in one batch
+        candidates = [shape for shape in self.shapes if not isinstance(shape, Plane)]
+        centers = self.project_points([shape.position for shape in candidates])
+        
+        for shape, center in zip(candidates, centers):
             if center:
                 dist = math.sqrt((center[0] - x)**2 + (center[1] - y)**2)
                 if dist < min_dist:
@@ -2384,7 +2808,7 @@ class Viewport3D:
             self.gizmo_visible = False
             self.update_property_panel()
             self.editor.log(f"Deleted {shape_type}", "warning")
-            self.render()
+            self.schedule_render()
     
     def copy_object(self):
         """Copy the selected object to clipboard"""
@@ -2450,7 +2874,7 @@ class Viewport3D:
         self.update_property_panel()
         
         self.editor.log(f"Pasted {obj_type} at ({new_pos.x:.1f}, {new_pos.y:.1f}, {new_pos.z:.1f})", "success")
-        self.render()
+        self.schedule_render()
     
     def start_animation(self):
         """Start animation loop"""
@@ -2463,8 +2887,9 @@ class Viewport3D:
             return
         
         # Update physics
+        changed = False
         if self.physics_enabled:
-            self.update_physics()
+            changed = self.update_physics()
         
         # Update player
         if self.player_controls_enabled and self.player:
@@ -2472,32 +2897,52 @@ class Viewport3D:
             
             # Check NPC proximity
             self.check_npc_proximity()
+            changed = True
         
-        # Render
-        self.render()
+        # Render only when this tick moved something. Input handlers and
+        # commands render their own changes, so a scene whose physics has
+        # come to rest costs nothing per tick
+        if changed:
+            self.render()
         
         # Continue animation
         self.canvas.after(16, self.animate)  # ~60 FPS
     
-    def update_physics(self):
-        """Update physics simulation"""
+    def update_physics(self) -> bool:
+        """Update physics simulation
+        
+        Returns whether any shape moved or rotated during this step.
+        """
+        moved = False
+        dt = self.dt
+        gravity_step = self.gravity * dt
+        
+        # Static planes never move, so collect them once per step instead of
+        # rescanning the whole scene for every moving shape
+        ground_planes = [other for other in self.shapes
+                         if isinstance(other, Plane) and other.is_static]
+        
         for shape in self.shapes:
             if not shape.has_physics or shape.is_static:
                 continue
             
+            velocity = shape.velocity
+            position = shape.position
+            old_x, old_y, old_z = position.x, position.y, position.z
+            
             # Apply gravity
-            shape.velocity.y += self.gravity * self.dt
+            velocity.y += gravity_step
             
             # Apply friction if on ground
             if shape.on_ground:
-                friction_factor = 1.0 - (shape.friction * self.dt * 5)
-                shape.velocity.x *= friction_factor
-                shape.velocity.z *= friction_factor
+                friction_factor = 1.0 - (shape.friction * dt * 5)
+                velocity.x *= friction_factor
+                velocity.z *= friction_factor
             
             # Update position
-            shape.position.x += shape.velocity.x * self.dt
-            shape.position.y += shape.velocity.y * self.dt
-            shape.position.z += shape.velocity.z * self.dt
+            position.x += velocity.x * dt
+            position.y += velocity.y * dt
+            position.z += velocity.z * dt
             
             # Rolling physics for spheres
             if isinstance(shape, Sphere) and shape.is_rolling and shape.on_ground:
@@ -2507,23 +2952,28 @@ class Viewport3D:
                     # Rotate around axis perpendicular to movement
                     shape.rotation.z += (shape.velocity.x / radius) * self.dt * 50
                     shape.rotation.x -= (shape.velocity.z / radius) * self.dt * 50
+                    moved = True
             
             # Ground collision
             shape.on_ground = False
-            for other in self.shapes:
-                if isinstance(other, Plane) and other.is_static:
-                    # Check if shape is on plane
-                    ground_level = other.position.y + shape.size / 2
-                    if shape.position.y <= ground_level:
-                        shape.position.y = ground_level
-                        
-                        # Bounce with restitution
-                        if shape.velocity.y < -0.1:
-                            shape.velocity.y = -shape.velocity.y * shape.restitution
-                        else:
-                            shape.velocity.y = 0
-                        
-                        shape.on_ground = True
+            for other in ground_planes:
+                # Check if shape is on plane
+                ground_level = other.position.y + shape.size / 2
+                if position.y <= ground_level:
+                    position.y = ground_level
+                    
+                    # Bounce with restitution
+                    if velocity.y < -0.1:
+                        velocity.y = -velocity.y * shape.restitution
+                    else:
+                        velocity.y = 0
+                    
+                    shape.on_ground = True
+            
+            if position.x != old_x or position.y != old_y or position.z != old_z:
+                moved = True
+        
+        return moved
     
     def update_player(self):
         """Update player movement"""
@@ -2670,14 +3120,16 @@ class Viewport3D:
                         
                         # Transform player position relative to wedge (accounting for rotation)
                         yaw_rad = math.radians(shape.rotation.y)
+                        cos_yaw = math.cos(-yaw_rad)
+                        sin_yaw = math.sin(-yaw_rad)
                         
                         # Relative position (player - wedge center)
                         rel_x = self.player.position.x - shape.position.x
                         rel_z = self.player.position.z - shape.position.z
                         
                         # Rotate relative position by negative yaw to get local coordinates
-                        local_x = rel_x * math.cos(-yaw_rad) - rel_z * math.sin(-yaw_rad)
-                        local_z = rel_x * math.sin(-yaw_rad) + rel_z * math.cos(-yaw_rad)
+                        local_x = rel_x * cos_yaw - rel_z * sin_yaw
+                        local_z = rel_x * sin_yaw + rel_z * cos_yaw
                         
                         # Check if within wedge bounds (X and Z)
                         if abs(local_x) < half_size_x and abs(local_z) < half_size_z:
@@ -2958,7 +3410,7 @@ say "3D scene ready!"
         self.editor.log(f"🎮 Gameplay mode: {mode}", "success")
         
         # Re-render to apply changes
-        self.render()
+        self.schedule_render()
     
     def update_mode_buttons(self):
         """Update mode button highlights"""
@@ -3019,7 +3471,7 @@ say "3D scene ready!"
                 self.log_code_output(f"Objects in scene: {len(self.shapes)}\n", "info")
                 
                 # Force render to show changes
-                self.render()
+                self.schedule_render()
             else:
                 self.log_code_output("ERROR: Interpreter not available\n", "error")
         
@@ -3077,7 +3529,7 @@ say "3D scene ready!"
             self.npc_dialogues[name] = []
         
         self.editor.log(f"👤 NPC '{name}' added at ({x}, {y}, {z})")
-        self.render()
+        self.schedule_render()
         
         return npc
     
@@ -3167,7 +3619,7 @@ say "3D scene ready!"
                 # Visual feedback - flash NPC color
                 original_color = npc.color
                 npc.color = "#ffffff"  # Flash white
-                self.render()
+                self.schedule_render()
                 
                 # Restore color after short delay
                 self.canvas.after(100, lambda: self.restore_npc_color(npc, original_color))
@@ -3175,7 +3627,7 @@ say "3D scene ready!"
     def restore_npc_color(self, npc, color):
         """Restore NPC color after interaction flash"""
         npc.color = color
-        self.render()
+        self.schedule_render()
     
     def play_dialogue_sound(self):
         """Play dialogue sound effect"""